@@ -0,0 +1,57 @@
+from dotenv import load_dotenv
+import os
+
+# Load settings from backend/app/.env (real environment variables take precedence)
+load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
+
+# Relative data file paths are resolved against the backend directory
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Similarity engine
+SIMILARITY_MODEL = os.getenv("SIMILARITY_MODEL", "en_core_web_md")
+SIMILARITY_CACHE_SIZE = int(os.getenv("SIMILARITY_CACHE_SIZE", "4096"))
+SUGGESTION_MIN_SIMILARITY = float(os.getenv("SUGGESTION_MIN_SIMILARITY", "0.35"))
+SUGGESTION_MAX_SECTIONS = int(os.getenv("SUGGESTION_MAX_SECTIONS", "2"))
+
+# Resume sessions
+SESSION_DB_PATH = os.path.join(BACKEND_DIR, os.getenv("SESSION_DB_PATH", "resume_sessions.db"))
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+
+# Background optimization jobs
+JOB_DB_PATH = os.path.join(BACKEND_DIR, os.getenv("JOB_DB_PATH", "optimization_jobs.db"))
+JOB_MAX_CONCURRENT = int(os.getenv("JOB_MAX_CONCURRENT", "2"))
+JOB_MAX_QUEUED = int(os.getenv("JOB_MAX_QUEUED", "20"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "60"))
+JOB_WORKER_AUTOSTART = os.getenv("JOB_WORKER_AUTOSTART", "true").lower() == "true"
+
+# Text generation ("model" runs flan-t5, "stub" is a deterministic fake for load testing)
+GENERATOR_MODE = os.getenv("GENERATOR_MODE", "model").lower()
+GENERATOR_MODEL = os.getenv("GENERATOR_MODEL", "google/flan-t5-base")
+STUB_GENERATOR_LATENCY_MS = float(os.getenv("STUB_GENERATOR_LATENCY_MS", "50"))
+
+# Production server (app.server)
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "0"))  # 0 sizes from CPUs and memory
+WORKER_THREADS = int(os.getenv("WORKER_THREADS", "0"))  # 0 splits CPUs evenly across workers
+WORKER_MEMORY_MB = int(os.getenv("WORKER_MEMORY_MB", "400"))  # Private memory budget per worker
+MODEL_MEMORY_MB = int(os.getenv("MODEL_MEMORY_MB", "2000"))  # Shared memory of the preloaded models
+WORKER_MAX_REQUESTS = int(os.getenv("WORKER_MAX_REQUESTS", "0"))  # 0 disables request-based recycling
+WORKER_MAX_AGE_SECONDS = int(os.getenv("WORKER_MAX_AGE_SECONDS", "0"))  # 0 disables age-based recycling
+WORKER_GRACEFUL_TIMEOUT = int(os.getenv("WORKER_GRACEFUL_TIMEOUT", "30"))
+
+# Section optimization latency budget
+OPTIMIZE_DEADLINE_MS = float(os.getenv("OPTIMIZE_DEADLINE_MS", "5000"))
+MODEL_LATENCY_ESTIMATE_MS = float(os.getenv("MODEL_LATENCY_ESTIMATE_MS", "1500"))  # Used until real calls are timed
+
+# Corpus statistics for IDF-weighted keyword relevance (built by app.services.corpus_builder)
+CORPUS_STATS_PATH = os.path.join(BACKEND_DIR, os.getenv("CORPUS_STATS_PATH", "corpus_stats.db"))
+CORPUS_MIN_DF = int(os.getenv("CORPUS_MIN_DF", "2"))  # Rarer terms are treated as unseen and not stored by name
+CORPUS_MAX_TERMS = int(os.getenv("CORPUS_MAX_TERMS", "50000"))  # Most common terms loaded at startup
+IDF_WEIGHT_FLOOR = float(os.getenv("IDF_WEIGHT_FLOOR", "0.5"))  # Relevance multiplier for the most common terms
+
+# Text normalization and pattern caches
+PATTERN_CACHE_SIZE = int(os.getenv("PATTERN_CACHE_SIZE", "4096"))  # Single-keyword and dynamic patterns
+KEYWORD_SET_CACHE_SIZE = int(os.getenv("KEYWORD_SET_CACHE_SIZE", "256"))  # Combined keyword set patterns
+NORMALIZE_CACHE_CHARS = int(os.getenv("NORMALIZE_CACHE_CHARS", "4000000"))  # Original + lowercase characters kept
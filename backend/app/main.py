@@ -1,16 +1,24 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from .models import *
 from .services.file_processor import process_resume_file
 from .services.keyword_extractor import extract_keywords, calculate_ats_score
 from .services.resume_optimizer import optimizer
+from .services.session_store import session_store
+from .services.job_store import job_store
+from .config import BACKEND_DIR, JOB_MAX_QUEUED, JOB_WORKER_AUTOSTART, OPTIMIZE_DEADLINE_MS
+import subprocess
 import logging
+import time
+import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Resume Optimizer API")
+app = FastAPI(title="Resume Optimizer API", default_response_class=ORJSONResponse)
 
 # Configure CORS
 app.add_middleware(
@@ -21,10 +29,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.post("/upload-resume", response_model=Resume)
+@app.middleware("http")
+async def record_arrival_time(request: Request, call_next):
+    """
+    Record when a request arrived, so latency budgets include time spent queued
+    """
+    request.state.received_at = time.monotonic()
+    return await call_next(request)
+
+@app.post("/upload-resume", response_model=ResumeSession)
 async def upload_resume(file: UploadFile = File(...)):
     """
-    Upload and process a resume file (PDF or DOCX)
+    Upload and process a resume file (PDF or DOCX) and open a resume session for it
     """
     try:
         if not file.filename.endswith(('.pdf', '.docx')):
@@ -34,50 +50,185 @@ async def upload_resume(file: UploadFile = File(...)):
             )
         
         resume = await process_resume_file(file)
-        return resume
+        # SQLite calls block, so keep them off the event loop
+        resume_id = await run_in_threadpool(session_store.create, resume)
+        return ResumeSession(resume_id=resume_id, **resume.model_dump())
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing resume: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def load_session_resume(resume_id: str, section_updates: Optional[List[ResumeSection]] = None) -> Resume:
+    """
+    Load a resume from its session, applying any changed sections, or fail with 404
+    """
+    resume = session_store.apply_section_updates(resume_id, section_updates or [])
+    if resume is None:
+        raise HTTPException(status_code=404, detail="Resume session not found or expired")
+    return resume
+
 @app.post("/analyze", response_model=AnalysisResult)
-async def analyze_resume(job_desc: JobDescription, resume: Resume):
+def analyze_resume(request: AnalyzeRequest):
     """
-    Analyze resume against job description
+    Analyze resume against job description. The resume is either sent in full or
+    referenced by resume_id, optionally with changed sections as section_updates.
     """
     try:
-        # Log what we're receiving for debugging
-        logger.info(f"Received job_desc: {job_desc}")
-        logger.info(f"Received resume: {resume}")
+        if request.resume_id:
+            resume = load_session_resume(request.resume_id, request.section_updates)
+        elif request.resume is not None:
+            resume = request.resume
+        else:
+            raise HTTPException(status_code=422, detail="Either resume or resume_id is required")
+        
+        logger.debug(
+            f"Analyzing resume ({len(resume.raw_text)} chars, {len(resume.sections)} sections) "
+            f"against job description ({len(request.job_desc.text)} chars)"
+        )
         
         # Extract keywords from job description
-        keywords = extract_keywords(job_desc.text)
+        keywords = extract_keywords(request.job_desc.text)
         
         # Calculate ATS score and analyze matches
         analysis = calculate_ats_score(resume, keywords)
+        
+        # Remember keyword relevance so later optimizations can prioritize by it
+        if request.resume_id:
+            session_store.save_keyword_relevance(request.resume_id, analysis.keyword_relevance)
         return analysis
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error analyzing resume: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/optimize-section", response_model=OptimizationResponse)
-async def optimize_section(request: OptimizationRequest):
+def optimize_section(request: OptimizationRequest, http_request: Request):
     """
-    Optimize a specific resume section with selected keywords
+    Optimize a specific resume section with selected keywords. Runs in the
+    threadpool so model calls do not block the event loop; the latency budget
+    counts from request arrival.
     """
     try:
-        optimization_result = optimize_resume_section(
-            request.current_content,
-            request.selected_keywords
+        current_content = request.current_content
+        keyword_relevance = request.keyword_relevance
+        if keyword_relevance is None and request.resume_id:
+            keyword_relevance = session_store.get_keyword_relevance(request.resume_id)
+        if current_content is None:
+            if not request.resume_id:
+                raise HTTPException(status_code=422, detail="Either current_content or resume_id is required")
+            resume = load_session_resume(request.resume_id)
+            section = next((s for s in resume.sections if s.title == request.section_title), None)
+            if section is None:
+                raise HTTPException(status_code=404, detail=f"Section '{request.section_title}' not found")
+            current_content = section.content
+        
+        optimization_result = optimizer.optimize_resume_section(
+            current_content,
+            request.selected_keywords,
+            deadline_ms=request.deadline_ms or OPTIMIZE_DEADLINE_MS,
+            keyword_relevance=keyword_relevance,
+            started_at=http_request.state.received_at
         )
         return optimization_result
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error optimizing section: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/jobs", response_model=JobStatus, status_code=202)
+def submit_optimization_job(request: JobSubmitRequest):
+    """
+    Queue a background job that optimizes several sections of a resume
+    """
+    keyword_relevance = request.keyword_relevance or {}
+    if request.resume_id:
+        resume = load_session_resume(request.resume_id)
+        if request.keyword_relevance is None:
+            keyword_relevance = session_store.get_keyword_relevance(request.resume_id)
+    elif request.resume is not None:
+        resume = request.resume
+    else:
+        raise HTTPException(status_code=422, detail="Either resume or resume_id is required")
+    
+    sections_by_title = {section.title: section for section in resume.sections}
+    unknown = [title for title in request.selected_keywords if title not in sections_by_title]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Sections not found: {', '.join(unknown)}")
+    
+    if job_store.count_active() >= JOB_MAX_QUEUED:
+        raise HTTPException(status_code=429, detail="Too many optimization jobs in progress, try again later")
+    
+    job_id = job_store.create([
+        {
+            'title': title,
+            'content': sections_by_title[title].content,
+            'keywords': keywords,
+            'keyword_relevance': {kw: keyword_relevance[kw] for kw in keywords if kw in keyword_relevance}
+        }
+        for title, keywords in request.selected_keywords.items()
+    ])
+    return job_store.get_status(job_id)
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+def get_optimization_job(job_id: str):
+    """
+    Get the status and progress of an optimization job
+    """
+    status = job_store.get_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return status
+
+@app.get("/jobs/{job_id}/result", response_model=JobResult)
+def get_optimization_job_result(job_id: str):
+    """
+    Get the optimized sections of a completed job
+    """
+    result = job_store.get_result(job_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if result.status != 'completed':
+        raise HTTPException(status_code=409, detail=f"Job is {result.status}")
+    return result
+
+@app.post("/jobs/{job_id}/cancel", response_model=JobStatus)
+def cancel_optimization_job(job_id: str):
+    """
+    Cancel a queued or running optimization job
+    """
+    status = job_store.request_cancel(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return status
+
+@app.on_event("startup")
+async def start_job_worker():
+    """
+    Start the background optimization worker process
+    """
+    if JOB_WORKER_AUTOSTART:
+        app.state.job_worker = subprocess.Popen(
+            [sys.executable, "-m", "app.services.job_worker"],
+            cwd=BACKEND_DIR
+        )
+
+@app.on_event("shutdown")
+async def stop_job_worker():
+    """
+    Stop the background optimization worker; unfinished jobs resume on next start
+    """
+    worker = getattr(app.state, "job_worker", None)
+    if worker is not None:
+        worker.terminate()
+        worker.wait(timeout=10)
+
 @app.get("/health")
 async def health_check():
     """
@@ -12,6 +12,15 @@ class Resume(BaseModel):
     sections: List[ResumeSection]
     raw_text: str
 
+class ResumeSession(Resume):
+    resume_id: str
+
+class AnalyzeRequest(BaseModel):
+    job_desc: JobDescription
+    resume: Optional[Resume] = None
+    resume_id: Optional[str] = None
+    section_updates: Optional[List[ResumeSection]] = None  # Changed sections of the session resume
+
 class Keyword(BaseModel):
     text: str
     category: str  # 'technical' or 'soft'
@@ -19,13 +28,17 @@ class Keyword(BaseModel):
 
 class OptimizationRequest(BaseModel):
     section_title: str
-    current_content: str
+    current_content: Optional[str] = None  # Looked up from the session when omitted
     selected_keywords: List[str]
+    resume_id: Optional[str] = None
+    deadline_ms: Optional[float] = None  # Defaults to OPTIMIZE_DEADLINE_MS
+    keyword_relevance: Optional[Dict[str, float]] = None  # Keyword -> relevance; defaults to the session's last analysis
 
 class OptimizationResponse(BaseModel):
     optimized_content: str
     added_keywords: List[str]
     confidence_score: float
+    bullet_methods: List[str] = []  # Per output line: 'model', 'rule' or 'unchanged'
 
 class AnalysisResult(BaseModel):
     ats_score: float
@@ -33,7 +46,27 @@ class AnalysisResult(BaseModel):
     matched_keywords: Dict[str, List[str]]
     section_scores: Dict[str, float]
     improvement_suggestions: Dict[str, List[str]]
+    keyword_relevance: Dict[str, float] = {}  # Keyword -> relevance score
 
 class Error(BaseModel):
     code: str
-    message: str
\ No newline at end of file
+    message: str
+
+class JobSubmitRequest(BaseModel):
+    resume: Optional[Resume] = None
+    resume_id: Optional[str] = None
+    selected_keywords: Dict[str, List[str]]  # Section title -> keywords to add
+    keyword_relevance: Optional[Dict[str, float]] = None  # Defaults to the session's last analysis
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: str  # 'queued', 'running', 'completed', 'failed' or 'cancelled'
+    completed_sections: int
+    total_sections: int
+    progress: float
+    error: Optional[str] = None
+
+class JobResult(BaseModel):
+    job_id: str
+    status: str
+    sections: Dict[str, OptimizationResponse]
@@ -0,0 +1,322 @@
+"""
+Production server entry point (POSIX only).
+
+Loads torch, flan-t5 and the spaCy models once in a parent process, then forks
+workers that share the read-only weights copy-on-write and serve the same
+listening socket. The background job worker is forked from the same parent, so
+it uses the same model copy. Run from the backend directory:
+    python -m app.server
+
+Signals: SIGTERM/SIGINT shut down gracefully, SIGHUP replaces workers one by one.
+Workers are also recycled after WORKER_MAX_REQUESTS requests or
+WORKER_MAX_AGE_SECONDS seconds when those are set.
+"""
+from . import config
+import logging
+import random
+import signal
+import socket
+import threading
+import time
+import gc
+import os
+
+logger = logging.getLogger(__name__)
+
+THREAD_ENV_VARS = [
+    "OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS", "VECLIB_MAXIMUM_THREADS"
+]
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may run on
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def available_memory_mb() -> int:
+    """
+    Available system memory in MB, from /proc/meminfo
+    """
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return 0
+
+def process_rss_mb(pid: int = 0) -> float:
+    """
+    Resident set size of a process in MB
+    """
+    with open(f"/proc/{pid or 'self'}/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+def size_workers() -> int:
+    """
+    Pick the worker count from available CPUs and memory, unless SERVER_WORKERS is set
+    """
+    if config.SERVER_WORKERS > 0:
+        return config.SERVER_WORKERS
+
+    cpus = available_cpus()
+    memory = available_memory_mb()
+    if not memory:
+        return cpus
+
+    by_memory = (memory - config.MODEL_MEMORY_MB) // config.WORKER_MEMORY_MB
+    return max(1, min(cpus, by_memory))
+
+def configure_threads(workers: int) -> int:
+    """
+    Split CPUs across workers for torch/BLAS; must run before those libraries are imported
+    """
+    threads = config.WORKER_THREADS or max(1, available_cpus() // workers)
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    return threads
+
+def preload():
+    """
+    Import the application so every model is loaded in the parent process
+    """
+    # Workers must not each start a job worker; the parent starts a single one instead
+    start_job_worker = config.JOB_WORKER_AUTOSTART
+    config.JOB_WORKER_AUTOSTART = False
+
+    from .main import app
+
+    # Move everything loaded so far out of the collector's reach, so garbage
+    # collection in workers does not touch (and copy) the shared pages
+    gc.collect()
+    gc.freeze()
+    return app, start_job_worker
+
+class Arbiter:
+    def __init__(self, app, workers: int, threads: int):
+        self.app = app
+        self.workers = workers
+        self.threads = threads
+        self.sock = None
+        self.children = {}  # pid -> start time
+        self.retiring = set()
+        self.job_worker = None  # pid of the forked job worker
+        self.stopping = False
+        self.reload_requested = False
+
+    def bind(self) -> None:
+        """
+        Open the listening socket shared by all workers
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((config.HOST, config.PORT))
+        self.sock.listen(2048)
+        self.sock.set_inheritable(True)
+
+    def spawn(self) -> None:
+        """
+        Fork one worker process
+        """
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.time()
+            return
+
+        # Child
+        exit_code = 0
+        try:
+            self.serve()
+        except Exception as e:
+            logger.error(f"Worker {os.getpid()} crashed: {str(e)}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def serve(self) -> None:
+        """
+        Run uvicorn on the shared socket inside a worker
+        """
+        import uvicorn
+
+        # uvicorn installs its own graceful SIGTERM/SIGINT handlers; reloads are the parent's job
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, signal.SIG_DFL)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        try:
+            import torch
+            torch.set_num_threads(self.threads)
+        except ImportError:
+            pass
+
+        server = uvicorn.Server(uvicorn.Config(
+            self.app,
+            limit_max_requests=config.WORKER_MAX_REQUESTS or None,
+            timeout_graceful_shutdown=config.WORKER_GRACEFUL_TIMEOUT,
+            log_level="info"
+        ))
+
+        if config.WORKER_MAX_AGE_SECONDS:
+            # Jitter the lifetime so workers do not all recycle at once
+            max_age = config.WORKER_MAX_AGE_SECONDS * random.uniform(0.9, 1.1)
+            timer = threading.Timer(max_age, lambda: setattr(server, "should_exit", True))
+            timer.daemon = True
+            timer.start()
+
+        logger.info(f"Worker {os.getpid()} serving with {self.threads} thread(s)")
+        server.run(sockets=[self.sock])
+
+    def start_job_worker(self) -> None:
+        """
+        Fork the single background optimization worker, which shares the preloaded models
+        """
+        pid = os.fork()
+        if pid:
+            self.job_worker = pid
+            return
+
+        # Child
+        exit_code = 0
+        try:
+            self.run_job_worker()
+        except Exception as e:
+            logger.error(f"Job worker {os.getpid()} crashed: {str(e)}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def run_job_worker(self) -> None:
+        """
+        Run the job worker loop inside a forked child
+        """
+        from .services.job_worker import run_worker
+
+        # Default SIGTERM/SIGINT end the process; jobs it was running are requeued once stale
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, signal.SIG_DFL)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        self.sock.close()
+
+        try:
+            import torch
+            torch.set_num_threads(self.threads)
+        except ImportError:
+            pass
+
+        logger.info(f"Job worker {os.getpid()} started")
+        run_worker()
+
+    def reap(self) -> None:
+        """
+        Collect exited workers and replace the ones that were not retired on purpose
+        """
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if pid == self.job_worker:
+                # Forget the PID once reaped so it is never signalled after being recycled
+                self.job_worker = None
+                if not self.stopping:
+                    logger.info(f"Job worker {pid} exited with code {os.waitstatus_to_exitcode(status)}, restarting it")
+                    self.start_job_worker()
+                continue
+            if pid in self.children:
+                started = self.children.pop(pid)
+                if pid in self.retiring:
+                    self.retiring.discard(pid)
+                elif not self.stopping:
+                    logger.info(f"Worker {pid} exited after {time.time() - started:.0f}s, replacing it")
+                    self.spawn()
+
+    def reload(self) -> None:
+        """
+        Replace workers one at a time, starting each replacement before retiring the old worker
+        """
+        for pid in list(self.children):
+            if self.stopping:
+                return
+            self.spawn()
+            self.retiring.add(pid)
+            os.kill(pid, signal.SIGTERM)
+            while pid in self.children and not self.stopping:
+                self.reap()
+                time.sleep(0.1)
+
+    def stop(self) -> None:
+        """
+        Ask every worker to finish in-flight requests and exit
+        """
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        if self.job_worker is not None:
+            os.kill(self.job_worker, signal.SIGTERM)
+
+        deadline = time.time() + config.WORKER_GRACEFUL_TIMEOUT + 5
+        while (self.children or self.job_worker is not None) and time.time() < deadline:
+            self.reap()
+            time.sleep(0.1)
+        for pid in list(self.children) + ([self.job_worker] if self.job_worker is not None else []):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    def run(self, start_job_worker: bool) -> None:
+        self.bind()
+        if start_job_worker:
+            self.start_job_worker()
+        for _ in range(self.workers):
+            self.spawn()
+
+        def handle_stop(signum, frame):
+            self.stopping = True
+
+        def handle_reload(signum, frame):
+            self.reload_requested = True
+
+        signal.signal(signal.SIGTERM, handle_stop)
+        signal.signal(signal.SIGINT, handle_stop)
+        signal.signal(signal.SIGHUP, handle_reload)
+
+        logger.info(f"Serving on {config.HOST}:{config.PORT} with {self.workers} worker(s)")
+        while not self.stopping:
+            if self.reload_requested:
+                self.reload_requested = False
+                logger.info("Reloading workers")
+                self.reload()
+            self.reap()
+            time.sleep(0.5)
+
+        logger.info("Shutting down")
+        self.stop()
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    workers = size_workers()
+    threads = configure_threads(workers)
+
+    start = time.time()
+    app, start_job_worker = preload()
+    logger.info(
+        f"Preloaded models in {time.time() - start:.1f}s, parent RSS {process_rss_mb():.0f} MB; "
+        f"starting {workers} worker(s) with {threads} thread(s) each"
+    )
+
+    Arbiter(app, workers, threads).run(start_job_worker)
+
+if __name__ == "__main__":
+    main()
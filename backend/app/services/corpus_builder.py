@@ -0,0 +1,148 @@
+"""
+Offline builder for the corpus statistics table used by IDF-weighted keyword relevance.
+
+Streams a directory of job descriptions (.txt/.md) through the extract_keywords
+pipeline with nlp.pipe and records, per document, the hashes of its extracted
+skills and 1-3 word n-grams. Document frequencies are kept per hash in a SQLite
+table; only terms in at least CORPUS_MIN_DF documents are stored by name, and
+the API loads those at startup. Re-running only processes new or changed files
+and removes deleted ones. Run from the backend directory:
+    python -m app.services.corpus_builder path/to/job_descriptions --n-process 4
+"""
+from ..config import CORPUS_STATS_PATH, CORPUS_MIN_DF
+from .corpus_stats import SCHEMA, term_hash
+from .keyword_extractor import nlp, keywords_from_doc
+from array import array
+from typing import Dict, Iterator, Set, Tuple
+import argparse
+import sqlite3
+import time
+import os
+import logging
+import spacy
+
+logger = logging.getLogger(__name__)
+
+CORPUS_EXTENSIONS = ('.txt', '.md')
+MAX_NGRAM = 3
+
+def iter_changed_documents(corpus_dir: str, known: Dict[str, str], seen: Set[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (lowercased text, (path, fingerprint)) for new or changed files, one file at a time.
+    Every path found is added to seen so deleted files can be detected afterwards.
+    """
+    for root, _, files in os.walk(corpus_dir):
+        for name in sorted(files):
+            if not name.lower().endswith(CORPUS_EXTENSIONS):
+                continue
+            path = os.path.relpath(os.path.join(root, name), corpus_dir)
+            stat = os.stat(os.path.join(root, name))
+            fingerprint = f"{stat.st_size}:{stat.st_mtime_ns}"
+            seen.add(path)
+            if known.get(path) == fingerprint:
+                continue
+            with open(os.path.join(root, name), encoding="utf-8", errors="ignore") as f:
+                yield f.read().lower(), (path, fingerprint)
+
+def document_terms(doc: spacy.tokens.Doc) -> Set[str]:
+    """
+    Distinct skills and n-grams of one job description
+    """
+    terms = {kw.text for kw in keywords_from_doc(doc.text, doc)}
+
+    words = [token.text for token in doc if not token.is_punct and not token.is_space]
+    stops = [token.is_stop for token in doc if not token.is_punct and not token.is_space]
+    for n in range(1, MAX_NGRAM + 1):
+        for i in range(len(words) - n + 1):
+            # Skip n-grams that start or end with a stop word ("of the", "and python")
+            if stops[i] or stops[i + n - 1]:
+                continue
+            terms.add(' '.join(words[i:i + n]))
+    return terms
+
+def _add_document(conn: sqlite3.Connection, path: str, fingerprint: str, terms: Set[str], min_df: int) -> None:
+    """
+    Store a document's term hashes and count it towards each term; a term's text is
+    kept once it reaches min_df documents
+    """
+    hashed = {term_hash(term): term for term in terms}
+    conn.execute(
+        "INSERT INTO corpus_documents (path, fingerprint, term_hashes) VALUES (?, ?, ?)",
+        (path, fingerprint, array('q', sorted(hashed)).tobytes())
+    )
+    conn.executemany(
+        """
+        INSERT INTO corpus_terms (hash, df, term) VALUES (?1, 1, CASE WHEN ?3 <= 1 THEN ?2 END)
+        ON CONFLICT(hash) DO UPDATE SET df = df + 1, term = CASE WHEN df + 1 >= ?3 THEN ?2 END
+        """,
+        [(h, term, min_df) for h, term in hashed.items()]
+    )
+
+def _remove_document(conn: sqlite3.Connection, path: str, min_df: int) -> None:
+    """
+    Remove a document and its contribution to the document frequencies
+    """
+    row = conn.execute("SELECT term_hashes FROM corpus_documents WHERE path = ?", (path,)).fetchone()
+    if row is None:
+        return
+    hashes = array('q')
+    hashes.frombytes(row[0])
+    conn.executemany(
+        "UPDATE corpus_terms SET df = df - 1, term = CASE WHEN df - 1 >= ?2 THEN term END WHERE hash = ?1",
+        [(h, min_df) for h in hashes]
+    )
+    conn.execute("DELETE FROM corpus_documents WHERE path = ?", (path,))
+
+def build_corpus_stats(corpus_dir: str, output: str = CORPUS_STATS_PATH, n_process: int = 1,
+                       batch_size: int = 64, min_df: int = CORPUS_MIN_DF) -> Dict[str, int]:
+    """
+    Create or incrementally update the statistics table for a corpus directory
+    """
+    conn = sqlite3.connect(output)
+    conn.executescript(SCHEMA)
+    known = dict(conn.execute("SELECT path, fingerprint FROM corpus_documents"))
+    seen: Set[str] = set()
+    counts = {'processed': 0, 'removed': 0}
+
+    texts = iter_changed_documents(corpus_dir, known, seen)
+    docs = nlp.pipe(texts, as_tuples=True, n_process=n_process, batch_size=batch_size)
+    for doc, (path, fingerprint) in docs:
+        _remove_document(conn, path, min_df)
+        _add_document(conn, path, fingerprint, document_terms(doc), min_df)
+
+        counts['processed'] += 1
+        if counts['processed'] % batch_size == 0:
+            conn.commit()
+            logger.info(f"Processed {counts['processed']} documents")
+
+    for path in set(known) - seen:
+        _remove_document(conn, path, min_df)
+        counts['removed'] += 1
+
+    conn.execute("DELETE FROM corpus_terms WHERE df <= 0")
+    conn.commit()
+    counts['documents'] = conn.execute("SELECT COUNT(*) FROM corpus_documents").fetchone()[0]
+    counts['terms'] = conn.execute("SELECT COUNT(*) FROM corpus_terms WHERE term IS NOT NULL").fetchone()[0]
+    conn.execute("VACUUM")
+    conn.close()
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Build document frequencies for IDF-weighted keyword relevance")
+    parser.add_argument("corpus_dir", help="Directory of job descriptions (.txt/.md), searched recursively")
+    parser.add_argument("--output", default=CORPUS_STATS_PATH)
+    parser.add_argument("--n-process", type=int, default=max(1, (os.cpu_count() or 1) - 1))
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    start = time.time()
+    counts = build_corpus_stats(args.corpus_dir, args.output, args.n_process, args.batch_size)
+    logger.info(
+        f"Processed {counts['processed']} new or changed and removed {counts['removed']} deleted documents "
+        f"in {time.time() - start:.1f}s; table now names {counts['terms']} terms found in at least "
+        f"{CORPUS_MIN_DF} of {counts['documents']} documents ({args.output})"
+    )
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -0,0 +1,81 @@
+from ..config import CORPUS_STATS_PATH, CORPUS_MIN_DF, CORPUS_MAX_TERMS, IDF_WEIGHT_FLOOR
+from typing import Dict
+import hashlib
+import sqlite3
+import math
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Terms are identified by a 64-bit hash. Each document keeps the packed hashes of its
+# terms (needed to undo its counts when it changes), and only terms with at least
+# CORPUS_MIN_DF documents keep their text, so the table grows with the vocabulary
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS corpus_documents (
+    path TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    term_hashes BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS corpus_terms (
+    hash INTEGER PRIMARY KEY,
+    df INTEGER NOT NULL,
+    term TEXT
+);
+"""
+
+def term_hash(term: str) -> int:
+    """
+    Stable signed 64-bit hash of a term, as stored in the statistics table
+    """
+    return int.from_bytes(hashlib.blake2b(term.encode(), digest_size=8).digest(), "little", signed=True)
+
+class CorpusStats:
+    """
+    Document frequencies of skills and n-grams across a corpus of job
+    descriptions, used to turn them into IDF weights
+    """
+    def __init__(self, path: str = CORPUS_STATS_PATH, min_df: int = CORPUS_MIN_DF,
+                 max_terms: int = CORPUS_MAX_TERMS, weight_floor: float = IDF_WEIGHT_FLOOR):
+        self.weight_floor = weight_floor
+        self.num_documents = 0
+        self.df: Dict[str, int] = {}
+
+        if not os.path.exists(path):
+            logger.info(f"No corpus statistics at {path}, keyword relevance will not be IDF-weighted")
+            return
+
+        with sqlite3.connect(path) as conn:
+            self.num_documents = conn.execute("SELECT COUNT(*) FROM corpus_documents").fetchone()[0]
+            # Rare terms get (close to) full weight anyway, so only the most common ones are kept
+            self.df = dict(conn.execute(
+                "SELECT term, df FROM corpus_terms WHERE term IS NOT NULL AND df >= ? ORDER BY df DESC LIMIT ?",
+                (min_df, max_terms)
+            ))
+        self.max_idf = self.idf(0)
+        logger.info(f"Loaded document frequencies for {len(self.df)} terms over {self.num_documents} documents")
+
+    @property
+    def loaded(self) -> bool:
+        return self.num_documents > 0
+
+    def idf(self, df: int) -> float:
+        """
+        Smoothed inverse document frequency
+        """
+        return math.log((self.num_documents + 1) / (df + 1)) + 1
+
+    def weight(self, term: str) -> float:
+        """
+        Relevance multiplier in [weight_floor, 1.0]: 1.0 for terms rare in the corpus,
+        weight_floor for terms that appear in every document
+        """
+        if not self.loaded:
+            return 1.0
+
+        # idf ranges from 1 (every document) to max_idf (no document)
+        normalized = (self.idf(self.df.get(term.lower(), 0)) - 1) / (self.max_idf - 1)
+        return self.weight_floor + (1 - self.weight_floor) * normalized
+
+# Load the statistics table once at startup
+corpus_stats = CorpusStats()
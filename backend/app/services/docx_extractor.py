@@ -0,0 +1,237 @@
+"""
+Streaming, structure-aware DOCX extraction.
+
+Reads word/document.xml straight out of the in-memory zip with an incremental
+XML parser and yields one record per paragraph with its style, heading level,
+bold/caps formatting and list membership. Parsed elements are discarded as
+soon as each paragraph is emitted, so memory stays bounded on large documents.
+"""
+from ..models import ResumeSection
+from ..utils.text_patterns import SECTION_HEADER_PATTERN
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+import xml.etree.ElementTree as ET
+import zipfile
+import re
+import io
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+HEADING_STYLE_PATTERN = re.compile(r'^heading\s*(\d)$', re.IGNORECASE)
+
+@dataclass
+class DocxStyle:
+    name: str
+    heading_level: Optional[int] = None
+    bold: bool = False
+    caps: bool = False
+
+@dataclass
+class DocxParagraph:
+    text: str
+    style: Optional[str] = None
+    heading_level: Optional[int] = None
+    bold: bool = False
+    caps: bool = False
+    is_list: bool = False
+
+def _flag(element: Optional[ET.Element]) -> bool:
+    """
+    Read an OOXML on/off property such as <w:b/> or <w:b w:val="0"/>
+    """
+    if element is None:
+        return False
+    return element.get(f"{W}val", "true") not in ("0", "false", "off")
+
+def _outline_level(element: ET.Element) -> Optional[int]:
+    """
+    Heading level (1-based) of a <w:outlineLvl> element; levels 0-8 are headings
+    and 9 means body text
+    """
+    level = int(element.get(f"{W}val", "0"))
+    return level + 1 if level < 9 else None
+
+def _parse_styles(archive: zipfile.ZipFile) -> Dict[str, DocxStyle]:
+    """
+    Map style IDs to their name, heading level and run formatting
+    """
+    if "word/styles.xml" not in archive.namelist():
+        return {}
+
+    styles = {}
+    with archive.open("word/styles.xml") as stream:
+        for _, element in ET.iterparse(stream, events=("end",)):
+            if element.tag != f"{W}style":
+                continue
+
+            style_id = element.get(f"{W}styleId")
+            name_element = element.find(f"{W}name")
+            name = name_element.get(f"{W}val", "") if name_element is not None else ""
+
+            heading_level = None
+            match = HEADING_STYLE_PATTERN.match(name)
+            outline = element.find(f"{W}pPr/{W}outlineLvl")
+            if match:
+                heading_level = int(match.group(1))
+            elif name.lower() == "title":
+                heading_level = 0
+            elif outline is not None:
+                heading_level = _outline_level(outline)
+
+            styles[style_id] = DocxStyle(
+                name=name,
+                heading_level=heading_level,
+                bold=_flag(element.find(f"{W}rPr/{W}b")),
+                caps=_flag(element.find(f"{W}rPr/{W}caps"))
+            )
+            element.clear()
+    return styles
+
+def _build_paragraph(element: ET.Element, styles: Dict[str, DocxStyle]) -> DocxParagraph:
+    """
+    Turn a <w:p> element into a paragraph record
+    """
+    properties = element.find(f"{W}pPr")
+    style_id = None
+    heading_level = None
+    has_outline = False
+    is_list = False
+    if properties is not None:
+        style_element = properties.find(f"{W}pStyle")
+        if style_element is not None:
+            style_id = style_element.get(f"{W}val")
+        outline = properties.find(f"{W}outlineLvl")
+        if outline is not None:
+            # An explicit level, including body text, overrides the style's
+            has_outline = True
+            heading_level = _outline_level(outline)
+        is_list = properties.find(f"{W}numPr") is not None
+
+    style = styles.get(style_id)
+    if style is not None:
+        if not has_outline:
+            heading_level = style.heading_level
+        # List styles such as "List Bullet" carry numbering in the style itself
+        is_list = is_list or style.name.lower().startswith("list")
+
+    parts = []
+    all_bold = all_caps = True
+    has_text = False
+    for run in element.iter(f"{W}r"):
+        run_text = []
+        for child in run:
+            if child.tag == f"{W}t" and child.text:
+                run_text.append(child.text)
+            elif child.tag == f"{W}tab":
+                run_text.append("\t")
+            elif child.tag in (f"{W}br", f"{W}cr"):
+                run_text.append("\n")
+        text = "".join(run_text)
+        parts.append(text)
+        if not text.strip():
+            continue
+
+        has_text = True
+        run_properties = run.find(f"{W}rPr")
+        bold_element = run_properties.find(f"{W}b") if run_properties is not None else None
+        caps_element = run_properties.find(f"{W}caps") if run_properties is not None else None
+        bold = _flag(bold_element) if bold_element is not None else bool(style and style.bold)
+        caps = _flag(caps_element) if caps_element is not None else bool(style and style.caps)
+        all_bold = all_bold and bold
+        all_caps = all_caps and (caps or text.upper() == text)
+
+    return DocxParagraph(
+        text="".join(parts).strip(),
+        style=style.name if style is not None else style_id,
+        heading_level=heading_level,
+        bold=has_text and all_bold,
+        caps=has_text and all_caps,
+        is_list=is_list
+    )
+
+def iter_docx_paragraphs(content: bytes) -> Iterator[DocxParagraph]:
+    """
+    Stream paragraphs, including those inside tables, out of a DOCX file in document order
+    """
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        styles = _parse_styles(archive)
+
+        with archive.open("word/document.xml") as stream:
+            body = None
+            depth = 0
+            paragraph_depth = 0
+            for event, element in ET.iterparse(stream, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if element.tag == f"{W}body":
+                        body = element
+                    elif element.tag == f"{W}p":
+                        paragraph_depth += 1
+                    continue
+
+                depth -= 1
+                if element.tag == f"{W}p":
+                    paragraph_depth -= 1
+                    # Nested paragraphs (e.g. text boxes) are emitted as part of their outer paragraph
+                    if paragraph_depth == 0:
+                        yield _build_paragraph(element, styles)
+                        element.clear()
+
+                # Drop finished top-level blocks so the tree never grows with the document
+                if body is not None and depth == 2:
+                    body.clear()
+
+def _is_formatted_header(paragraph: DocxParagraph, max_words: int) -> bool:
+    """
+    Whether a short, non-list paragraph reads like a header rather than a list
+    of items ("SQL, AWS | GCP") or a sentence
+    """
+    text = paragraph.text
+    return (
+        not paragraph.is_list
+        and len(text.split()) <= max_words
+        and not text.endswith('.')
+        and any(c.isalpha() for c in text)
+        and not any(c in text for c in ',|;')
+    )
+
+def sections_from_paragraphs(paragraphs: List[DocxParagraph]) -> List[ResumeSection]:
+    """
+    Build resume sections from document structure. Heading-styled paragraphs are
+    used as section headers when the document has them. Otherwise, paragraphs
+    that consist of a known section name ("EXPERIENCE", "Skills:") are used, and
+    only when there are none, short fully capitalised or bold paragraphs.
+    """
+    paragraphs = [p for p in paragraphs if p.text]
+
+    # The title (level 0) is usually the candidate's name, not a section
+    headers = [p for p in paragraphs if p.heading_level]
+    if not headers:
+        headers = [p for p in paragraphs if not p.is_list and SECTION_HEADER_PATTERN.fullmatch(p.text)]
+    if not headers:
+        headers = [p for p in paragraphs if p.caps and _is_formatted_header(p, 5)]
+    if not headers:
+        headers = [p for p in paragraphs if p.bold and _is_formatted_header(p, 4)]
+    if not headers:
+        return []
+
+    # Only the top level in use starts a section; deeper headings stay in the content
+    top_level = min(p.heading_level or 1 for p in headers)
+    header_ids = {id(p) for p in headers if (p.heading_level or 1) == top_level}
+
+    sections = []
+    current_title = None
+    current_content = []
+    for paragraph in paragraphs:
+        if id(paragraph) in header_ids:
+            if current_title and current_content:
+                sections.append(ResumeSection(title=current_title, content='\n'.join(current_content)))
+            current_title = paragraph.text
+            current_content = []
+        elif current_title:
+            current_content.append(paragraph.text)
+
+    if current_title and current_content:
+        sections.append(ResumeSection(title=current_title, content='\n'.join(current_content)))
+
+    return sections
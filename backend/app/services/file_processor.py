@@ -1,10 +1,9 @@
 from fastapi import UploadFile
 from ..models import Resume, ResumeSection
-import docx2txt
+from .docx_extractor import iter_docx_paragraphs, sections_from_paragraphs
+from ..utils.text_patterns import SECTION_HEADER_PATTERN
 from pdf2image import convert_from_bytes
 import pytesseract
-import io
-import re
 import logging
 import fitz
 
@@ -16,15 +15,17 @@ async def process_resume_file(file: UploadFile) -> Resume:
     """
     content = await file.read()
     
+    sections = []
     if file.filename.endswith('.pdf'):
         raw_text = extract_from_pdf(content)
     elif file.filename.endswith('.docx'):
-        raw_text = extract_from_docx(content)
+        raw_text, sections = extract_sections_from_docx(content)
     else:
         raise ValueError("Unsupported file format")
 
-    # Parse sections from raw text
-    sections = parse_resume_sections(raw_text)
+    # Fall back to header heuristics when the document has no usable structure
+    if not sections:
+        sections = parse_resume_sections(raw_text)
     
     return Resume(
         sections=sections,
@@ -52,8 +53,16 @@ def extract_from_docx(content: bytes) -> str:
     """
     Extract text from DOCX file
     """
+    return extract_sections_from_docx(content)[0]
+
+def extract_sections_from_docx(content: bytes) -> tuple[str, list[ResumeSection]]:
+    """
+    Extract text and structure-based sections from DOCX file in a single streaming pass
+    """
     try:
-        return docx2txt.process(io.BytesIO(content))
+        paragraphs = list(iter_docx_paragraphs(content))
+        raw_text = '\n'.join(p.text for p in paragraphs)
+        return raw_text, sections_from_paragraphs(paragraphs)
     except Exception as e:
         logger.error(f"Error extracting text from DOCX: {str(e)}")
         raise
@@ -62,23 +71,6 @@ def parse_resume_sections(text: str) -> list[ResumeSection]:
     """
     Parse resume into sections based on common section headers
     """
-    # Common section headers in resumes
-    section_headers = [
-        "EDUCATION",
-        "EXPERIENCE",
-        "WORK EXPERIENCE",
-        "SKILLS",
-        "TECHNICAL SKILLS",
-        "PROJECTS",
-        "CERTIFICATIONS",
-        "AWARDS",
-        "PROFESSIONAL SUMMARY",
-        "OBJECTIVE"
-    ]
-    
-    # Create regex pattern for finding sections
-    pattern = f"({'|'.join(section_headers)})[:\\s]*"
-    
     # Split text into sections
     sections = []
     current_section = ""
@@ -86,7 +78,7 @@ def parse_resume_sections(text: str) -> list[ResumeSection]:
     
     for line in text.split('\n'):
         # Check if line is a section header
-        if re.match(pattern, line.strip().upper()):
+        if SECTION_HEADER_PATTERN.match(line.strip()):
             # Save previous section if it exists
             if current_section and current_content:
                 sections.append(ResumeSection(
@@ -0,0 +1,236 @@
+from ..models import JobStatus, JobResult, OptimizationResponse
+from ..config import JOB_DB_PATH, JOB_MAX_CONCURRENT
+from typing import List, Dict, Optional, Tuple
+import sqlite3
+import json
+import uuid
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+class JobStore:
+    def __init__(self, db_path: str = JOB_DB_PATH):
+        self.db_path = db_path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS optimization_jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    sections TEXT NOT NULL,
+                    results TEXT NOT NULL DEFAULT '{}',
+                    error TEXT,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    heartbeat_at REAL,
+                    claim_token TEXT
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection in autocommit mode so claims can use explicit transactions
+        """
+        return sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+
+    def create(self, sections: List[Dict]) -> str:
+        """
+        Queue a job. Each section is a dict with title, content and keywords.
+        """
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO optimization_jobs (id, status, sections, created_at) VALUES (?, 'queued', ?, ?)",
+                (job_id, json.dumps(sections), time.time())
+            )
+        return job_id
+
+    def count_active(self) -> int:
+        """
+        Count jobs that are queued or running
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM optimization_jobs WHERE status IN (?, ?)", ACTIVE_STATUSES
+            ).fetchone()
+        return row[0]
+
+    def _fetch(self, job_id: str) -> Optional[sqlite3.Row]:
+        """
+        Load a raw job row
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            return conn.execute("SELECT * FROM optimization_jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def get_status(self, job_id: str) -> Optional[JobStatus]:
+        """
+        Get the status and progress of a job
+        """
+        row = self._fetch(job_id)
+        if row is None:
+            return None
+
+        total = len(json.loads(row['sections']))
+        completed = len(json.loads(row['results']))
+        return JobStatus(
+            job_id=job_id,
+            status=row['status'],
+            completed_sections=completed,
+            total_sections=total,
+            progress=round(completed / total, 4) if total else 1.0,
+            error=row['error']
+        )
+
+    def get_result(self, job_id: str) -> Optional[JobResult]:
+        """
+        Get the per-section optimization results of a job
+        """
+        row = self._fetch(job_id)
+        if row is None:
+            return None
+
+        results = json.loads(row['results'])
+        return JobResult(
+            job_id=job_id,
+            status=row['status'],
+            sections={title: OptimizationResponse(**result) for title, result in results.items()}
+        )
+
+    def get_sections(self, job_id: str) -> List[Dict]:
+        """
+        Get the sections a job has to optimize
+        """
+        row = self._fetch(job_id)
+        return json.loads(row['sections']) if row else []
+
+    def get_completed_titles(self, job_id: str) -> List[str]:
+        """
+        Get titles of the sections already optimized, so restarted jobs can skip them
+        """
+        row = self._fetch(job_id)
+        return list(json.loads(row['results']).keys()) if row else []
+
+    def request_cancel(self, job_id: str) -> Optional[JobStatus]:
+        """
+        Cancel a queued job immediately, or flag a running job for the worker to stop
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE optimization_jobs SET status = 'cancelled' WHERE id = ? AND status = 'queued'",
+                (job_id,)
+            )
+            conn.execute(
+                "UPDATE optimization_jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'",
+                (job_id,)
+            )
+        return self.get_status(job_id)
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        """
+        Check whether a running job has been asked to stop
+        """
+        row = self._fetch(job_id)
+        return bool(row and row['cancel_requested'])
+
+    def claim_next(self, max_concurrent: int = JOB_MAX_CONCURRENT) -> Optional[Tuple[str, str]]:
+        """
+        Atomically move the oldest queued job to running, unless the concurrency limit is reached.
+        Returns the job ID and a claim token that later writes for this run must present.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            running = conn.execute(
+                "SELECT COUNT(*) FROM optimization_jobs WHERE status = 'running'"
+            ).fetchone()[0]
+            row = None
+            if running < max_concurrent:
+                row = conn.execute(
+                    "SELECT id FROM optimization_jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+            token = uuid.uuid4().hex
+            if row is not None:
+                conn.execute(
+                    "UPDATE optimization_jobs SET status = 'running', heartbeat_at = ?, claim_token = ? WHERE id = ?",
+                    (time.time(), token, row[0])
+                )
+            conn.execute("COMMIT")
+            return (row[0], token) if row else None
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def heartbeat(self, claims: Dict[str, str]) -> None:
+        """
+        Mark running jobs as alive, given job ID -> claim token
+        """
+        if not claims:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE optimization_jobs SET heartbeat_at = ? WHERE id = ? AND claim_token = ? AND status = 'running'",
+                [(time.time(), job_id, token) for job_id, token in claims.items()]
+            )
+
+    def requeue_stale(self, stale_seconds: float) -> int:
+        """
+        Requeue running jobs whose worker stopped sending heartbeats (e.g. after a restart).
+        Their claim is revoked, so a run that is in fact still going can no longer write.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE optimization_jobs SET status = 'queued', claim_token = NULL "
+                "WHERE status = 'running' AND heartbeat_at < ?",
+                (time.time() - stale_seconds,)
+            )
+        if cursor.rowcount:
+            logger.warning(f"Requeued {cursor.rowcount} stale optimization job(s)")
+        return cursor.rowcount
+
+    def save_section_result(self, job_id: str, token: str, title: str, result: OptimizationResponse) -> bool:
+        """
+        Record the optimization result of one section; returns False if the claim was lost
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT results FROM optimization_jobs WHERE id = ? AND claim_token = ?", (job_id, token)
+            ).fetchone()
+            if row is not None:
+                results = json.loads(row[0])
+                results[title] = result.model_dump()
+                conn.execute(
+                    "UPDATE optimization_jobs SET results = ?, heartbeat_at = ? WHERE id = ?",
+                    (json.dumps(results), time.time(), job_id)
+                )
+            conn.execute("COMMIT")
+            return row is not None
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def finish(self, job_id: str, token: str, status: str, error: Optional[str] = None) -> bool:
+        """
+        Move a job to a terminal status; returns False if the claim was lost
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE optimization_jobs SET status = ?, error = ?, claim_token = NULL "
+                "WHERE id = ? AND claim_token = ?",
+                (status, error, job_id, token)
+            )
+        return cursor.rowcount > 0
+
+# Initialize the store
+job_store = JobStore()
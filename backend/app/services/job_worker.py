@@ -0,0 +1,108 @@
+"""
+Background worker for whole-resume optimization jobs.
+
+Polls the SQLite job store, runs up to JOB_MAX_CONCURRENT jobs at a time and
+records per-section results as they finish. Started automatically by the API
+(see JOB_WORKER_AUTOSTART) or on its own from the backend directory:
+    python -m app.services.job_worker
+"""
+from ..config import JOB_MAX_CONCURRENT, JOB_POLL_INTERVAL, JOB_STALE_SECONDS
+from .job_store import job_store
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class JobCancelled(Exception):
+    pass
+
+class JobClaimLost(Exception):
+    pass
+
+def run_job(job_id: str, token: str) -> None:
+    """
+    Optimize every section of a job, skipping sections finished before a restart.
+    Stops without writing anything further if the job was requeued under another claim.
+    """
+    # Import lazily so the model is only loaded once the worker actually has work
+    from .resume_optimizer import optimizer
+
+    try:
+        completed = set(job_store.get_completed_titles(job_id))
+        for section in job_store.get_sections(job_id):
+            if section['title'] in completed:
+                continue
+            if job_store.is_cancel_requested(job_id):
+                raise JobCancelled()
+
+            result = optimizer.optimize_resume_section(
+                section['content'],
+                section['keywords'],
+                keyword_relevance=section.get('keyword_relevance')
+            )
+            if not job_store.save_section_result(job_id, token, section['title'], result):
+                raise JobClaimLost()
+
+        if not job_store.finish(job_id, token, 'completed'):
+            raise JobClaimLost()
+        logger.info(f"Optimization job {job_id} completed")
+
+    except JobClaimLost:
+        logger.warning(f"Optimization job {job_id} was requeued while running, abandoning this run")
+    except JobCancelled:
+        job_store.finish(job_id, token, 'cancelled')
+        logger.info(f"Optimization job {job_id} cancelled")
+    except Exception as e:
+        logger.error(f"Error running optimization job {job_id}: {str(e)}")
+        job_store.finish(job_id, token, 'failed', str(e))
+
+def run_worker(max_concurrent: int = JOB_MAX_CONCURRENT, poll_interval: float = JOB_POLL_INTERVAL) -> None:
+    """
+    Claim and run queued jobs until the process is stopped
+    """
+    active = {}  # job ID -> claim token
+    lock = threading.Lock()
+
+    def heartbeat():
+        while True:
+            with lock:
+                running = dict(active)
+            try:
+                job_store.heartbeat(running)
+            except Exception as e:
+                # Keep beating; a missed beat is retried on the next round
+                logger.error(f"Error sending job heartbeat: {str(e)}")
+            time.sleep(min(poll_interval * 5, JOB_STALE_SECONDS / 3))
+
+    def run(job_id: str, token: str):
+        try:
+            run_job(job_id, token)
+        finally:
+            with lock:
+                active.pop(job_id, None)
+
+    threading.Thread(target=heartbeat, daemon=True).start()
+    logger.info(f"Optimization worker started (max {max_concurrent} concurrent jobs)")
+
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        while True:
+            job_store.requeue_stale(JOB_STALE_SECONDS)
+
+            claim = None
+            with lock:
+                if len(active) < max_concurrent:
+                    claim = job_store.claim_next(max_concurrent)
+                    if claim:
+                        active[claim[0]] = claim[1]
+
+            if claim:
+                logger.info(f"Starting optimization job {claim[0]}")
+                executor.submit(run, *claim)
+            else:
+                time.sleep(poll_interval)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_worker()
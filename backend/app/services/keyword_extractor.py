@@ -1,6 +1,11 @@
 from ..models import Resume, Keyword, AnalysisResult
+from ..config import SUGGESTION_MIN_SIMILARITY, SUGGESTION_MAX_SECTIONS
+from .similarity import similarity_engine
+from .corpus_stats import corpus_stats
+from ..utils.skills import TECHNICAL_SKILLS, SOFT_SKILLS
+from ..utils.text_patterns import normalize, compile_pattern, count_keyword, find_keywords
+import numpy as np
 import spacy
-import re
 from typing import List, Dict
 from collections import defaultdict
 import logging
@@ -10,40 +15,39 @@ logger = logging.getLogger(__name__)
 # Load spaCy model
 nlp = spacy.load("en_core_web_sm")
 
-# Define common technical and soft skills
-TECHNICAL_SKILLS = {
-    'languages': [
-        'python', 'java', 'javascript', 'c++', 'ruby', 'php', 'swift', 'kotlin',
-        'golang', 'rust', 'typescript', 'sql', 'html', 'css'
-    ],
-    'frameworks': [
-        'react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js',
-        'express', 'fastapi', 'pytorch', 'tensorflow', 'keras'
-    ],
-    'tools': [
-        'docker', 'kubernetes', 'aws', 'gcp', 'azure', 'git', 'jenkins',
-        'jira', 'postgresql', 'mongodb', 'mysql', 'redis', 'elasticsearch'
-    ],
-    'concepts': [
-        'machine learning', 'deep learning', 'nlp', 'computer vision',
-        'data science', 'agile', 'ci/cd', 'devops', 'microservices',
-        'rest api', 'graphql', 'oauth', 'jwt'
-    ]
-}
-
-SOFT_SKILLS = [
-    'leadership', 'communication', 'teamwork', 'problem solving',
-    'analytical', 'project management', 'time management', 'adaptability',
-    'collaboration', 'creativity', 'critical thinking', 'decision making',
-    'mentoring', 'presentation', 'negotiation'
+# Every predefined skill, scanned for in a single pass
+PREDEFINED_SKILLS = [skill for skills in TECHNICAL_SKILLS.values() for skill in skills] + SOFT_SKILLS
+
+# Skill-related terms often found in job descriptions, each followed by the skill itself
+SKILL_INDICATOR_PATTERNS = [
+    compile_pattern(rf'{indicator}\s+([\w\s\-\/]+)')
+    for indicator in ['experience with', 'knowledge of', 'proficiency in', 'skilled in',
+                      'familiarity with', 'background in', 'expertise in', 'working knowledge']
 ]
 
+# Words around a term that suggest it is a skill
+SKILL_LEFT_CONTEXT = {'skilled', 'experience', 'knowledge', 'proficient'}
+SKILL_RIGHT_CONTEXT = {'experience', 'skills', 'knowledge'}
+
+# Section titles that suit a keyword no vector is known for
+FALLBACK_SECTION_WORDS = ('skill', 'experience')
+
+# Words around a keyword that suggest it is important
+IMPORTANCE_WORDS = {'required', 'essential', 'must', 'key', 'primary', 'core',
+                    'preferred', 'desired', 'important', 'necessary'}
+
 def extract_keywords(text: str) -> List[Keyword]:
     """
     Extract and categorize keywords from text - combining predefined lists and dynamic extraction
     """
+    return keywords_from_doc(text, nlp(normalize(text).lower))
+
+def keywords_from_doc(text: str, doc: spacy.tokens.Doc) -> List[Keyword]:
+    """
+    Extract keywords from text that has already been parsed into doc,
+    so batches can be parsed with nlp.pipe
+    """
     keywords = []
-    doc = nlp(text.lower())
     
     # Extract from predefined lists
     from_predefined = extract_from_predefined_lists(text, doc)
@@ -66,11 +70,12 @@ def extract_from_predefined_lists(text: str, doc: spacy.tokens.Doc) -> List[Keyw
     Extract keywords from predefined lists
     """
     keywords = []
+    present = find_keywords(text, PREDEFINED_SKILLS)
     
     # Extract technical skills
     for category, skills in TECHNICAL_SKILLS.items():
         for skill in skills:
-            if re.search(rf'\b{re.escape(skill)}\b', text.lower()):
+            if skill in present:
                 # Calculate relevance score based on frequency and context
                 score = calculate_relevance_score(doc, skill)
                 keywords.append(Keyword(
@@ -81,7 +86,7 @@ def extract_from_predefined_lists(text: str, doc: spacy.tokens.Doc) -> List[Keyw
     
     # Extract soft skills
     for skill in SOFT_SKILLS:
-        if re.search(rf'\b{re.escape(skill)}\b', text.lower()):
+        if skill in present:
             score = calculate_relevance_score(doc, skill)
             keywords.append(Keyword(
                 text=skill,
@@ -96,23 +101,18 @@ def extract_dynamic_keywords(text: str, doc: spacy.tokens.Doc) -> List[Keyword]:
     Extract keywords dynamically from text using NLP techniques
     """
     keywords = []
-    
-    # Skill-related terms often found in job descriptions
-    skill_indicators = ['experience with', 'knowledge of', 'proficiency in', 'skilled in', 
-                       'familiarity with', 'background in', 'expertise in', 'working knowledge']
+    text_lower = normalize(text).lower
     
     # Extract noun phrases following skill indicators
-    for indicator in skill_indicators:
-        pattern = rf'{indicator}\s+([\w\s\-\/]+)'
-        matches = re.finditer(pattern, text.lower())
-        for match in matches:
+    for pattern in SKILL_INDICATOR_PATTERNS:
+        for match in pattern.finditer(text_lower):
             if match.group(1):
                 skill = match.group(1).strip()
                 if len(skill.split()) < 4:  # Avoid very long phrases
                     keywords.append(Keyword(
                         text=skill,
                         category='technical' if is_technical_skill(skill) else 'soft',
-                        relevance_score=0.8
+                        relevance_score=0.8 * corpus_stats.weight(skill)
                     ))
     
     # Extract named entities that might be technologies or tools
@@ -123,18 +123,19 @@ def extract_dynamic_keywords(text: str, doc: spacy.tokens.Doc) -> List[Keyword]:
                 keywords.append(Keyword(
                     text=text,
                     category='technical',
-                    relevance_score=0.7
+                    relevance_score=0.7 * corpus_stats.weight(text)
                 ))
     
     # Extract other potentially important terms
     important_pos = ["NOUN", "PROPN"]
+    skill_terms = likely_skill_terms(doc)
     for token in doc:
         if token.pos_ in important_pos and not token.is_stop and len(token.text) > 3:
-            if is_likely_skill(token.text.lower(), doc):
+            if token.lower_ in skill_terms:
                 keywords.append(Keyword(
-                    text=token.text.lower(),
+                    text=token.lower_,
                     category='technical',
-                    relevance_score=0.6
+                    relevance_score=0.6 * corpus_stats.weight(token.text)
                 ))
     
     return keywords
@@ -150,26 +151,25 @@ def is_technical_skill(text: str) -> bool:
     
     return any(indicator in text for indicator in technical_indicators)
 
-def is_likely_skill(text: str, doc: spacy.tokens.Doc) -> bool:
+def likely_skill_terms(doc: spacy.tokens.Doc) -> set:
     """
-    Determine if a term is likely a skill based on context
+    Lowercased terms that appear at least once in a context suggesting a skill,
+    computed in a single pass over the document
     """
-    # Check if it appears in contexts that suggest it's a skill
+    terms = set()
     for token in doc:
-        if token.text.lower() == text:
-            # Check left context
-            left_context = doc[max(0, token.i-3):token.i]
-            for left_token in left_context:
-                if left_token.text.lower() in ['skilled', 'experience', 'knowledge', 'proficient']:
-                    return True
-            
-            # Check right context
-            right_context = doc[token.i+1:min(len(doc), token.i+4)]
-            for right_token in right_context:
-                if right_token.text.lower() in ['experience', 'skills', 'knowledge']:
-                    return True
-    
-    return False
+        # Check left context
+        left_context = doc[max(0, token.i-3):token.i]
+        if any(left_token.lower_ in SKILL_LEFT_CONTEXT for left_token in left_context):
+            terms.add(token.lower_)
+            continue
+        
+        # Check right context
+        right_context = doc[token.i+1:min(len(doc), token.i+4)]
+        if any(right_token.lower_ in SKILL_RIGHT_CONTEXT for right_token in right_context):
+            terms.add(token.lower_)
+    
+    return terms
 
 def calculate_relevance_score(doc: spacy.tokens.Doc, keyword: str) -> float:
     """
@@ -177,28 +177,74 @@ def calculate_relevance_score(doc: spacy.tokens.Doc, keyword: str) -> float:
     - Frequency
     - Context (proximity to important words)
     - Position in document
+    - Rarity across the job description corpus (IDF), when corpus statistics are available
     """
-    frequency = len(re.findall(rf'\b{re.escape(keyword)}\b', doc.text.lower()))
+    frequency = count_keyword(doc.text, keyword)
     
     # Find keyword mentions and their contexts
-    importance_words = ['required', 'essential', 'must', 'key', 'primary', 'core', 
-                       'preferred', 'desired', 'important', 'necessary']
     context_score = 0
     
     for token in doc:
-        if token.text.lower() in keyword:
+        if token.lower_ in keyword:
             # Check surrounding words
             surrounding = doc[max(0, token.i-5):min(len(doc), token.i+6)]
             for word in surrounding:
-                if word.text.lower() in importance_words:
+                if word.lower_ in IMPORTANCE_WORDS:
                     context_score += 1
     
     # Normalize scores
     freq_score = min(frequency / 3, 1.0)  # Cap at 1.0
     context_score = min(context_score / 2, 1.0)
     
-    # Combine scores (weighted average)
-    return (freq_score * 0.7) + (context_score * 0.3)
+    # Combine scores (weighted average), discounting terms common to most postings
+    return ((freq_score * 0.7) + (context_score * 0.3)) * corpus_stats.weight(keyword)
+
+def rank_sections_for_keywords(resume: Resume, keywords: List[str]) -> Dict[str, List[str]]:
+    """
+    Pick the best-fitting resume sections for each keyword using one
+    keyword x bullet cosine similarity matrix
+    """
+    if not keywords or not resume.sections:
+        return {}
+    
+    # Flatten sections into bullets, remembering which section each bullet came from
+    bullets = []
+    bullet_sections = []
+    for index, section in enumerate(resume.sections):
+        lines = [line.strip() for line in section.content.split('\n') if line.strip()]
+        for line in lines or [section.title]:
+            bullets.append(line)
+            bullet_sections.append(index)
+    
+    keyword_vectors = similarity_engine.embed(keywords)
+    similarity = keyword_vectors @ similarity_engine.embed(bullets).T
+    
+    # Keywords the vector model does not know embed as zero vectors and fit no section;
+    # suggest those for the skills/experience sections, or every section if there are none
+    fallback_titles = [
+        section.title for section in resume.sections
+        if any(word in section.title.lower() for word in FALLBACK_SECTION_WORDS)
+    ] or [section.title for section in resume.sections]
+    has_vector = np.linalg.norm(keyword_vectors, axis=1) > 0
+    
+    # Section fit is the similarity of its best matching bullet
+    section_fit = np.full((len(keywords), len(resume.sections)), -1.0, dtype=np.float32)
+    np.maximum.at(section_fit.T, np.asarray(bullet_sections), similarity.T)
+    
+    ranked = {}
+    for row, keyword in enumerate(keywords):
+        if not has_vector[row]:
+            ranked[keyword] = fallback_titles
+            continue
+        order = np.argsort(-section_fit[row])[:SUGGESTION_MAX_SECTIONS]
+        titles = [
+            resume.sections[i].title for i in order
+            if section_fit[row, i] >= SUGGESTION_MIN_SIMILARITY
+        ]
+        # Always suggest at least the single best section
+        ranked[keyword] = titles or [resume.sections[order[0]].title]
+    
+    return ranked
 
 def calculate_ats_score(resume: Resume, keywords: List[Keyword]) -> AnalysisResult:
     """
@@ -210,28 +256,29 @@ def calculate_ats_score(resume: Resume, keywords: List[Keyword]) -> AnalysisResu
     improvement_suggestions = defaultdict(list)
     
     # Check each keyword against resume content
+    suggestion_candidates = []
+    keyword_texts = [kw.text for kw in keywords]
+    in_resume = find_keywords(resume.raw_text, keyword_texts)
     for keyword in keywords:
-        keyword_pattern = rf'\b{re.escape(keyword.text)}\b'
-        
         # Check in full resume text first
-        if re.search(keyword_pattern, resume.raw_text, re.IGNORECASE):
+        if keyword.text in in_resume:
             matched_keywords[keyword.category].append(keyword.text)
         else:
             missing_keywords[keyword.category].append(keyword.text)
-            
-            # Generate improvement suggestions for sections
-            for section in resume.sections:
-                if keyword.relevance_score > 0.7:  # High relevance keywords
-                    suggestion = f"Consider adding '{keyword.text}' to this section"
-                    if suggestion not in improvement_suggestions[section.title]:
-                        improvement_suggestions[section.title].append(suggestion)
+            if keyword.relevance_score > 0.7:  # High relevance keywords
+                suggestion_candidates.append(keyword.text)
+    
+    # Generate improvement suggestions only for the sections each keyword fits best
+    for keyword_text, section_titles in rank_sections_for_keywords(resume, suggestion_candidates).items():
+        for title in section_titles:
+            suggestion = f"Consider adding '{keyword_text}' to this section"
+            if suggestion not in improvement_suggestions[title]:
+                improvement_suggestions[title].append(suggestion)
     
     # Calculate section-specific scores
     for section in resume.sections:
-        section_matches = sum(
-            1 for kw in keywords 
-            if re.search(rf'\b{re.escape(kw.text)}\b', section.content, re.IGNORECASE)
-        )
+        in_section = find_keywords(section.content, keyword_texts)
+        section_matches = sum(1 for kw in keywords if kw.text in in_section)
         section_scores[section.title] = (section_matches / len(keywords) * 100) if len(keywords) > 0 else 0
     
     # Calculate overall ATS score
@@ -244,5 +291,6 @@ def calculate_ats_score(resume: Resume, keywords: List[Keyword]) -> AnalysisResu
         missing_keywords=dict(missing_keywords),
         matched_keywords=dict(matched_keywords),
         section_scores=section_scores,
-        improvement_suggestions=dict(improvement_suggestions)
+        improvement_suggestions=dict(improvement_suggestions),
+        keyword_relevance={kw.text: kw.relevance_score for kw in keywords}
     )
\ No newline at end of file
@@ -1,18 +1,55 @@
 from ..models import OptimizationResponse
-from typing import List, Dict
+from ..config import GENERATOR_MODE, GENERATOR_MODEL, STUB_GENERATOR_LATENCY_MS, MODEL_LATENCY_ESTIMATE_MS
+from .rule_rewriter import rule_rewriter
+from ..utils.text_patterns import METRIC_PATTERN, compile_pattern, find_keywords
+from typing import List, Dict, Optional
 import spacy
-from transformers import pipeline
-import re
+import time
+import math
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
 # Load spaCy model
 nlp = spacy.load("en_core_web_sm")
 
+# Prompt fields the stub generator echoes back
+PROMPT_KEYWORDS_PATTERN = compile_pattern(r'keywords \((.*?)\):')
+PROMPT_ORIGINAL_PATTERN = compile_pattern(r'Original: (.*)')
+
+class StubGenerator:
+    """
+    Deterministic stand-in for the text2text pipeline, used to measure the rest
+    of the stack without model inference cost
+    """
+    def __init__(self, latency_ms: float = STUB_GENERATOR_LATENCY_MS):
+        self.latency = latency_ms / 1000
+
+    def __call__(self, prompt: str, **kwargs) -> List[Dict[str, str]]:
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        keywords = PROMPT_KEYWORDS_PATTERN.search(prompt)
+        original = PROMPT_ORIGINAL_PATTERN.search(prompt)
+        text = original.group(1).strip() if original else ""
+        if keywords and keywords.group(1):
+            text = f"{text.rstrip('.')} using {keywords.group(1)}"
+        return [{'generated_text': text}]
+
+def load_generator():
+    """
+    Load the text generation model, or the stub when GENERATOR_MODE=stub
+    """
+    if GENERATOR_MODE == "stub":
+        logger.info(f"Using stub generator ({STUB_GENERATOR_LATENCY_MS} ms per call)")
+        return StubGenerator()
+
+    from transformers import pipeline
+    return pipeline("text2text-generation", model=GENERATOR_MODEL)
+
 # Initialize text generation model
-generator = pipeline("text2text-generation", model="google/flan-t5-base")
+generator = load_generator()
 
 class ResumeOptimizer:
     def __init__(self):
@@ -21,37 +58,71 @@ class ResumeOptimizer:
             "implemented", "designed", "analyzed", "collaborated", "initiated",
             "launched", "optimized", "reduced", "increased", "streamlined"
         ]
+        # Recent model call durations (seconds), used to predict whether another call fits the deadline
+        self.model_latencies = deque([MODEL_LATENCY_ESTIMATE_MS / 1000], maxlen=50)
         
-    def optimize_resume_section(self, current_content: str, selected_keywords: List[str]) -> OptimizationResponse:
+    def optimize_resume_section(
+        self,
+        current_content: str,
+        selected_keywords: List[str],
+        deadline_ms: Optional[float] = None,
+        keyword_relevance: Optional[Dict[str, float]] = None,
+        started_at: Optional[float] = None
+    ) -> OptimizationResponse:
         """
-        Optimize resume section content by incorporating selected keywords
+        Optimize resume section content by incorporating selected keywords.
+        
+        Bullets are handled in order of the relevance of their missing keywords.
+        Easy cases are rewritten by template insertion; the rest go to the model
+        while the predicted model latency still fits within deadline_ms, and
+        fall back to template insertion after that. The deadline runs from
+        started_at (a time.monotonic() value, e.g. request arrival) when given.
         """
         try:
+            start = started_at if started_at is not None else time.monotonic()
+            deadline = start + deadline_ms / 1000 if deadline_ms else math.inf
+            keyword_relevance = keyword_relevance or {}
+            
             # Split content into bullet points
             bullet_points = [p.strip() for p in current_content.split('\n') if p.strip()]
             
-            optimized_points = []
+            optimized_points = list(bullet_points)
+            bullet_methods = ['unchanged'] * len(bullet_points)
             added_keywords = set()
             total_confidence = 0
             
-            for point in bullet_points:
-                # Check which keywords are missing from this point
-                missing_kw = [kw for kw in selected_keywords 
-                             if not re.search(rf'\b{re.escape(kw)}\b', point, re.IGNORECASE)]
-                
+            # Check which keywords are missing from each point
+            missing = {}
+            for index, point in enumerate(bullet_points):
+                present = find_keywords(point, selected_keywords)
+                missing_kw = [kw for kw in selected_keywords if kw not in present]
                 if missing_kw:
-                    # Generate optimized version of the point
-                    new_point = self._optimize_bullet_point(point, missing_kw)
-                    optimized_points.append(new_point)
-                    
-                    # Track which keywords were successfully added
-                    for kw in missing_kw:
-                        if re.search(rf'\b{re.escape(kw)}\b', new_point, re.IGNORECASE):
-                            added_keywords.add(kw)
+                    missing[index] = missing_kw
+            
+            # Most valuable bullets first, so the model budget goes where it matters most
+            priority = sorted(
+                missing,
+                key=lambda i: -sum(keyword_relevance.get(kw, 1.0) for kw in missing[i])
+            )
+            
+            for index in priority:
+                point, missing_kw = bullet_points[index], missing[index]
+                
+                if rule_rewriter.is_easy(point, missing_kw):
+                    new_point, method = rule_rewriter.rewrite(point, missing_kw), 'rule'
+                elif time.monotonic() + self._predicted_model_latency() <= deadline:
+                    new_point, method = self._optimize_bullet_point(point, missing_kw), 'model'
                 else:
-                    optimized_points.append(point)
+                    new_point, method = rule_rewriter.rewrite(point, missing_kw), 'rule'
+                
+                optimized_points[index] = new_point
+                bullet_methods[index] = method
                 
-                # Calculate confidence score for this point
+                # Track which keywords were successfully added
+                added_keywords.update(find_keywords(new_point, missing_kw))
+            
+            # Calculate confidence score for each point
+            for point in bullet_points:
                 total_confidence += self._calculate_confidence_score(point, selected_keywords)
             
             # Calculate overall confidence score
@@ -60,13 +131,21 @@ class ResumeOptimizer:
             return OptimizationResponse(
                 optimized_content='\n'.join(optimized_points),
                 added_keywords=list(added_keywords),
-                confidence_score=avg_confidence
+                confidence_score=avg_confidence,
+                bullet_methods=bullet_methods
             )
         
         except Exception as e:
             logger.error(f"Error optimizing resume section: {str(e)}")
             raise
 
+    def _predicted_model_latency(self) -> float:
+        """
+        Conservative (95th percentile) estimate of one model call in seconds
+        """
+        latencies = sorted(self.model_latencies)
+        return latencies[min(len(latencies) - 1, math.ceil(0.95 * len(latencies)) - 1)]
+
     def _optimize_bullet_point(self, point: str, keywords: List[str]) -> str:
         """
         Optimize a single bullet point by incorporating keywords
@@ -91,7 +170,9 @@ class ResumeOptimizer:
             """
             
             # Generate optimized version
+            started = time.monotonic()
             response = generator(prompt, max_length=100, num_return_sequences=1)
+            self.model_latencies.append(time.monotonic() - started)
             optimized = response[0]['generated_text'].strip()
             
             # Ensure it starts with an action verb
@@ -154,8 +235,7 @@ class ResumeOptimizer:
         Extract quantifiable metrics from the text
         """
         # Look for numbers followed by % or other metrics
-        metric_pattern = r'\d+(?:\.\d+)?%|\d+(?:\.\d+)?\s*(?:x|times|hrs?|hours?|days?|months?|years?|k|M|B|million|billion)'
-        return re.findall(metric_pattern, text)
+        return METRIC_PATTERN.findall(text)
 
     def _starts_with_action_verb(self, text: str) -> bool:
         """
@@ -179,8 +259,8 @@ class ResumeOptimizer:
         if not keywords:
             return 1.0
         
-        matches = sum(1 for kw in keywords 
-                     if re.search(rf'\b{re.escape(kw)}\b', text, re.IGNORECASE))
+        present = find_keywords(text, keywords)
+        matches = sum(1 for kw in keywords if kw in present)
         return matches / len(keywords)
 
     def _calculate_action_verb_score(self, text: str) -> float:
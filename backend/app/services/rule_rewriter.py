@@ -0,0 +1,93 @@
+from ..utils.skills import TECHNICAL_SKILLS, SOFT_SKILLS
+from ..utils.text_patterns import BULLET_PARTS_PATTERN, find_keywords
+from typing import List
+
+# Leading verbs of bullets describing hands-on technical work, where "using X" reads naturally
+TECHNICAL_VERBS = {
+    "architected", "automated", "built", "coded", "configured", "created", "debugged",
+    "deployed", "designed", "developed", "engineered", "implemented", "integrated",
+    "maintained", "migrated", "optimized", "programmed", "refactored", "scaled", "tested"
+}
+
+# Leading verbs of bullets describing work with people, where "demonstrating X" reads naturally
+PEOPLE_VERBS = {
+    "coached", "collaborated", "coordinated", "facilitated", "guided", "led", "managed",
+    "mentored", "negotiated", "organized", "partnered", "presented", "supervised", "trained"
+}
+
+# Words showing a bullet involves other people even when it starts with a technical verb
+PEOPLE_WORDS = [
+    "team", "teams", "stakeholders", "clients", "customers", "engineers", "colleagues",
+    "cross-functional", "partners", "users"
+]
+
+class RuleBasedRewriter:
+    """
+    Deterministic template insertion of keywords into bullet points, used for
+    easy cases and for bullets the model has no time left for
+    """
+    def __init__(self, max_words: int = 25, max_easy_keywords: int = 2):
+        self.max_words = max_words
+        self.max_easy_keywords = max_easy_keywords
+        self.soft_skills = set(SOFT_SKILLS)
+        self.technical_skills = [skill for skills in TECHNICAL_SKILLS.values() for skill in skills]
+
+    def is_easy(self, point: str, keywords: List[str]) -> bool:
+        """
+        Whether the keywords can be appended as clauses and still read naturally.
+
+        The bullet must stay short and start with an action verb (so it describes
+        work, not e.g. a skill list), and every keyword has to fit the kind of work
+        described: technical keywords need hands-on technical work (a technical
+        verb, or a technical skill already mentioned) and soft skills need work
+        with people (a people verb, or mentions of teams, clients and the like).
+        Anything else goes to the model.
+        """
+        if not keywords or len(keywords) > self.max_easy_keywords:
+            return False
+        added_words = sum(len(kw.split()) for kw in keywords) + 2 * len(keywords)
+        if len(point.split()) + added_words > self.max_words:
+            return False
+
+        body = BULLET_PARTS_PATTERN.match(point.strip()).group(2)
+        first_word = body.split()[0].lower() if body.split() else ''
+        if first_word not in TECHNICAL_VERBS and first_word not in PEOPLE_VERBS:
+            return False
+
+        technical = any(kw.lower() not in self.soft_skills for kw in keywords)
+        soft = any(kw.lower() in self.soft_skills for kw in keywords)
+        if technical and not (first_word in TECHNICAL_VERBS or find_keywords(body, self.technical_skills)):
+            return False
+        if soft and not (first_word in PEOPLE_VERBS or find_keywords(body, PEOPLE_WORDS)):
+            return False
+        return True
+
+    def rewrite(self, point: str, keywords: List[str]) -> str:
+        """
+        Append keywords as "using X and Y" (technical) / "demonstrating X" (soft) clauses
+        """
+        technical = [kw for kw in keywords if kw.lower() not in self.soft_skills]
+        soft = [kw for kw in keywords if kw.lower() in self.soft_skills]
+
+        # Keep any leading bullet marker and the trailing punctuation in place
+        match = BULLET_PARTS_PATTERN.match(point.strip())
+        marker, body, ending = match.group(1) or '', match.group(2), match.group(3)
+
+        clauses = []
+        if technical:
+            clauses.append(f"using {self._join(technical)}")
+        if soft:
+            clauses.append(f"demonstrating {self._join(soft)}")
+
+        return f"{marker}{body} {', '.join(clauses)}{ending}"
+
+    def _join(self, items: List[str]) -> str:
+        """
+        Join items as "a", "a and b" or "a, b and c"
+        """
+        if len(items) == 1:
+            return items[0]
+        return f"{', '.join(items[:-1])} and {items[-1]}"
+
+# Initialize the rewriter
+rule_rewriter = RuleBasedRewriter()
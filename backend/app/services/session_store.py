@@ -0,0 +1,137 @@
+from ..models import Resume, ResumeSection
+from ..config import SESSION_DB_PATH, SESSION_TTL_SECONDS
+from typing import Dict, List, Optional
+import sqlite3
+import json
+import uuid
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ResumeSessionStore:
+    def __init__(self, db_path: str = SESSION_DB_PATH, ttl_seconds: int = SESSION_TTL_SECONDS):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS resume_sessions (
+                    id TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    keyword_relevance TEXT NOT NULL DEFAULT '{}',
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the session database
+        """
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def create(self, resume: Resume) -> str:
+        """
+        Store a resume and return its session ID
+        """
+        resume_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            # Drop expired sessions whenever a new one is written
+            conn.execute("DELETE FROM resume_sessions WHERE expires_at < ?", (now,))
+            conn.execute(
+                "INSERT INTO resume_sessions (id, payload, expires_at) VALUES (?, ?, ?)",
+                (resume_id, resume.model_dump_json(), now + self.ttl_seconds)
+            )
+        return resume_id
+
+    def get(self, resume_id: str) -> Optional[Resume]:
+        """
+        Load a resume by session ID and refresh its TTL, or return None if missing or expired
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM resume_sessions WHERE id = ? AND expires_at >= ?",
+                (resume_id, now)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE resume_sessions SET expires_at = ? WHERE id = ?",
+                (now + self.ttl_seconds, resume_id)
+            )
+        return Resume.model_validate_json(row[0])
+
+    def save_keyword_relevance(self, resume_id: str, keyword_relevance: Dict[str, float]) -> None:
+        """
+        Keep the keyword relevance scores of the latest analysis with the session
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE resume_sessions SET keyword_relevance = ? WHERE id = ?",
+                (json.dumps(keyword_relevance), resume_id)
+            )
+
+    def get_keyword_relevance(self, resume_id: str) -> Dict[str, float]:
+        """
+        Keyword relevance scores of the latest analysis, or an empty dict if there was none
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT keyword_relevance FROM resume_sessions WHERE id = ?", (resume_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def apply_section_updates(self, resume_id: str, updates: List[ResumeSection]) -> Optional[Resume]:
+        """
+        Apply section deltas to a stored resume, keeping raw_text in sync, and persist the result.
+        The read-modify-write runs in one transaction so concurrent updates are not lost.
+        """
+        if not updates:
+            return self.get(resume_id)
+
+        now = time.time()
+        conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT payload FROM resume_sessions WHERE id = ? AND expires_at >= ?",
+                (resume_id, now)
+            ).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return None
+
+            resume = Resume.model_validate_json(row[0])
+            sections = {section.title: section for section in resume.sections}
+            raw_text = resume.raw_text
+            for update in updates:
+                current = sections.get(update.title)
+                if current is None:
+                    resume.sections.append(update)
+                    raw_text = f"{raw_text}\n{update.title}\n{update.content}"
+                else:
+                    if current.content and current.content in raw_text:
+                        raw_text = raw_text.replace(current.content, update.content, 1)
+                    else:
+                        raw_text = f"{raw_text}\n{update.content}"
+                    current.content = update.content
+                sections[update.title] = update if current is None else current
+            resume.raw_text = raw_text
+
+            conn.execute(
+                "UPDATE resume_sessions SET payload = ?, expires_at = ? WHERE id = ?",
+                (resume.model_dump_json(), now + self.ttl_seconds, resume_id)
+            )
+            conn.execute("COMMIT")
+            return resume
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+# Initialize the store
+session_store = ResumeSessionStore()
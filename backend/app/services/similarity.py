@@ -0,0 +1,99 @@
+from ..config import SIMILARITY_MODEL, SIMILARITY_CACHE_SIZE
+from collections import OrderedDict
+from typing import List
+import numpy as np
+import spacy
+import threading
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+def load_vector_model(name: str) -> spacy.language.Language:
+    """
+    Load a spaCy model with word vectors, falling back to en_core_web_sm
+    """
+    try:
+        return spacy.load(name)
+    except OSError:
+        logger.warning(
+            f"Vector model '{name}' is not installed, falling back to en_core_web_sm "
+            f"(similarity will use context tensors instead of word vectors)"
+        )
+        return spacy.load("en_core_web_sm")
+
+class SimilarityEngine:
+    def __init__(self, model_name: str = SIMILARITY_MODEL, cache_size: int = SIMILARITY_CACHE_SIZE):
+        self.nlp = load_vector_model(model_name)
+        self.has_vectors = self.nlp.vocab.vectors.shape[0] > 0
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, text: str) -> str:
+        """
+        Hash text into a cache key
+        """
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts into a (len(texts), dim) matrix of unit vectors, reusing cached vectors
+        """
+        keys = [self._key(text) for text in texts]
+        if not texts:
+            return np.zeros((0, self.nlp.vocab.vectors_length), dtype=np.float32)
+
+        # Only run the model over texts we have not seen yet. Vectors are copied out
+        # under the lock, so concurrent evictions cannot remove them mid-request.
+        vectors = {}
+        pending = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                if key in vectors or key in pending:
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    vectors[key] = cached
+                else:
+                    pending[key] = text
+
+        if pending:
+            # Static word vectors only need the tokenizer; otherwise run the pipeline for tensors
+            if self.has_vectors:
+                docs = (self.nlp.make_doc(text) for text in pending.values())
+            else:
+                docs = self.nlp.pipe(pending.values())
+
+            for key, doc in zip(pending.keys(), docs):
+                vector = np.asarray(doc.vector, dtype=np.float32)
+                norm = np.linalg.norm(vector)
+                vectors[key] = vector / norm if norm > 0 else vector
+
+            with self._lock:
+                for key in pending:
+                    self._cache[key] = vectors[key]
+                # Evict least recently used vectors
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return np.vstack([vectors[key] for key in keys])
+
+    def similarity_matrix(self, rows: List[str], cols: List[str]) -> np.ndarray:
+        """
+        Cosine similarity of every row text against every column text, shape (len(rows), len(cols))
+        """
+        if not rows or not cols:
+            return np.zeros((len(rows), len(cols)), dtype=np.float32)
+
+        return self.embed(rows) @ self.embed(cols).T
+
+    def similarity(self, text1: str, text2: str) -> float:
+        """
+        Cosine similarity between two texts
+        """
+        return float(self.similarity_matrix([text1], [text2])[0, 0])
+
+# Initialize the engine
+similarity_engine = SimilarityEngine()
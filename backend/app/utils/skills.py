@@ -0,0 +1,27 @@
+# Define common technical and soft skills
+TECHNICAL_SKILLS = {
+    'languages': [
+        'python', 'java', 'javascript', 'c++', 'ruby', 'php', 'swift', 'kotlin',
+        'golang', 'rust', 'typescript', 'sql', 'html', 'css'
+    ],
+    'frameworks': [
+        'react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js',
+        'express', 'fastapi', 'pytorch', 'tensorflow', 'keras'
+    ],
+    'tools': [
+        'docker', 'kubernetes', 'aws', 'gcp', 'azure', 'git', 'jenkins',
+        'jira', 'postgresql', 'mongodb', 'mysql', 'redis', 'elasticsearch'
+    ],
+    'concepts': [
+        'machine learning', 'deep learning', 'nlp', 'computer vision',
+        'data science', 'agile', 'ci/cd', 'devops', 'microservices',
+        'rest api', 'graphql', 'oauth', 'jwt'
+    ]
+}
+
+SOFT_SKILLS = [
+    'leadership', 'communication', 'teamwork', 'problem solving',
+    'analytical', 'project management', 'time management', 'adaptability',
+    'collaboration', 'creativity', 'critical thinking', 'decision making',
+    'mentoring', 'presentation', 'negotiation'
+]
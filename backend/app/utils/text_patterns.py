@@ -0,0 +1,156 @@
+"""
+Shared text normalization and compiled regex patterns.
+
+Documents are normalized once into a lowercase view and reused by every
+keyword lookup; the normalized documents are cached up to a total number of
+characters, not a number of entries, since resumes and job descriptions vary
+widely in size. Keyword patterns, including combined patterns that find a
+whole keyword set in one scan, are compiled on first use and kept in bounded
+caches; the fixed bullet, metric and header patterns are compiled once at import.
+"""
+from ..config import PATTERN_CACHE_SIZE, KEYWORD_SET_CACHE_SIZE, NORMALIZE_CACHE_CHARS
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Iterable, Set, Tuple
+import threading
+import re
+
+BULLET_MARKERS = r'•\-\*○►‣⁃·'
+
+SECTION_HEADERS = [
+    "EDUCATION",
+    "EXPERIENCE",
+    "WORK EXPERIENCE",
+    "SKILLS",
+    "TECHNICAL SKILLS",
+    "PROJECTS",
+    "CERTIFICATIONS",
+    "AWARDS",
+    "PROFESSIONAL SUMMARY",
+    "OBJECTIVE"
+]
+
+# Resume section header at the start of a line
+SECTION_HEADER_PATTERN = re.compile(f"({'|'.join(SECTION_HEADERS)})[:\\s]*", re.IGNORECASE)
+
+# Bullet point text up to the next marker or the end of the text
+BULLET_POINT_PATTERN = re.compile(
+    f"(?:[{BULLET_MARKERS}])\\s*(.+?)(?=(?:[{BULLET_MARKERS}])|$)",
+    re.MULTILINE | re.DOTALL
+)
+
+# Bullet marker at the start of a line
+LEADING_BULLET_PATTERN = re.compile(f"^[{BULLET_MARKERS}]\\s*")
+
+# Bullet split into optional marker, body and closing punctuation
+BULLET_PARTS_PATTERN = re.compile(f"^([{BULLET_MARKERS}]\\s*)?(.*?)([.!?]?)$", re.DOTALL)
+
+# Anything but word characters, whitespace, periods and commas
+NON_TEXT_PATTERN = re.compile(r'[^\w\s.,]')
+
+# Any metric: percentages, dollar amounts, plain numbers and k/M/B suffixes
+HAS_METRIC_PATTERN = re.compile(
+    r'\d+%'                     # Percentages
+    r'|\$\d+(?:,\d{3})*'        # Dollar amounts
+    r'|\d+(?:,\d{3})*\+?'       # Numbers with commas
+    r'|\d+k\+?'                 # Numbers with k (thousand)
+    r'|\d+M\+?'                 # Numbers with M (million)
+    r'|\d+B\+?'                 # Numbers with B (billion)
+)
+
+# Quantifiable metrics worth keeping when a bullet is rewritten
+METRIC_PATTERN = re.compile(
+    r'\d+(?:\.\d+)?%|\d+(?:\.\d+)?\s*(?:x|times|hrs?|hours?|days?|months?|years?|k|M|B|million|billion)'
+)
+
+class NormalizedText:
+    """
+    A document with its lowercase view, computed once
+    """
+    __slots__ = ('original', 'lower')
+
+    def __init__(self, original: str):
+        self.original = original
+        self.lower = original.lower()
+
+# Normalized documents, least recently used first, and the characters they hold
+_normalized: "OrderedDict[str, NormalizedText]" = OrderedDict()
+_normalized_chars = 0
+_normalized_lock = threading.Lock()
+
+def normalize(text: str) -> NormalizedText:
+    """
+    Normalize a document once; repeated calls with the same text reuse the result.
+    Documents too large to share the cache budget are normalized but not kept.
+    """
+    global _normalized_chars
+    with _normalized_lock:
+        cached = _normalized.get(text)
+        if cached is not None:
+            _normalized.move_to_end(text)
+            return cached
+
+    normalized = NormalizedText(text)
+    size = len(text) + len(normalized.lower)
+    if size > NORMALIZE_CACHE_CHARS // 8:
+        return normalized
+
+    with _normalized_lock:
+        if text not in _normalized:
+            _normalized[text] = normalized
+            _normalized_chars += size
+            while _normalized_chars > NORMALIZE_CACHE_CHARS:
+                _, evicted = _normalized.popitem(last=False)
+                _normalized_chars -= len(evicted.original) + len(evicted.lower)
+    return normalized
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a dynamic pattern once and keep it in a bounded cache
+    """
+    return re.compile(pattern, flags)
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def keyword_pattern(keyword: str) -> re.Pattern:
+    """
+    Whole-word pattern for a keyword, matched against a lowercase view
+    """
+    return re.compile(rf'\b{re.escape(keyword.lower())}\b')
+
+@lru_cache(maxsize=KEYWORD_SET_CACHE_SIZE)
+def keyword_set_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """
+    One pattern reporting, at every word boundary, the longest keyword of the set
+    that matches there as a whole word; keywords must be lowercase. Sets extracted
+    from a job description are mostly one-off, so this cache is kept small.
+    """
+    alternatives = '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf'\b(?=({alternatives})\b)')
+
+def find_keywords(text: str, keywords: Iterable[str]) -> Set[str]:
+    """
+    The keywords that occur in text as whole words (case-insensitive), found in a single scan
+    """
+    by_lower = {}
+    for kw in keywords:
+        by_lower.setdefault(kw.lower(), []).append(kw)
+    if not by_lower:
+        return set()
+
+    text_lower = normalize(text).lower
+    found = {match.group(1) for match in keyword_set_pattern(tuple(sorted(by_lower))).finditer(text_lower)}
+
+    # A keyword can be hidden behind a longer one starting at the same position
+    # ("rest" inside "rest api"); check those individually
+    for kw in by_lower.keys() - found:
+        if any(other.startswith(kw) for other in found) and keyword_pattern(kw).search(text_lower):
+            found.add(kw)
+
+    return {original for kw in found for original in by_lower[kw]}
+
+def count_keyword(text: str, keyword: str) -> int:
+    """
+    Case-insensitive whole-word keyword count
+    """
+    return len(keyword_pattern(keyword).findall(normalize(text).lower))
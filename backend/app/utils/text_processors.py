@@ -1,7 +1,10 @@
-import re
 from typing import List, Dict, Set
 import spacy
 from collections import defaultdict
+from ..services.similarity import similarity_engine
+from .text_patterns import (
+    NON_TEXT_PATTERN, BULLET_POINT_PATTERN, LEADING_BULLET_PATTERN, HAS_METRIC_PATTERN, normalize
+)
 
 # Load spaCy model
 nlp = spacy.load("en_core_web_sm")
@@ -22,7 +25,7 @@ class TextProcessor:
         Clean and normalize text
         """
         # Remove special characters but keep periods and commas
-        text = re.sub(r'[^\w\s.,]', ' ', text)
+        text = NON_TEXT_PATTERN.sub(' ', text)
         # Remove extra whitespace
         text = ' '.join(text.split())
         return text.strip()
@@ -31,7 +34,7 @@ class TextProcessor:
         """
         Identify which section a piece of text belongs to
         """
-        text_lower = text.lower()
+        text_lower = normalize(text).lower
         
         for section_type, variants in self.common_sections.items():
             if any(variant in text_lower for variant in variants):
@@ -43,14 +46,8 @@ class TextProcessor:
         """
         Extract bullet points from text
         """
-        # Common bullet point markers
-        markers = [r'•', r'-', r'\*', r'○', r'►', r'‣', r'⁃', r'·']
-        
-        # Create pattern for bullet points
-        pattern = f"(?:{'|'.join(markers)})\\s*(.+?)(?=(?:{'|'.join(markers)})|$)"
-        
         # Find all bullet points
-        points = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
+        points = BULLET_POINT_PATTERN.findall(text)
         
         # Clean and filter empty points
         return [self.clean_text(point) for point in points if point.strip()]
@@ -66,17 +63,7 @@ class TextProcessor:
         """
         Check if text contains metrics (numbers, percentages, etc.)
         """
-        # Patterns for different types of metrics
-        patterns = [
-            r'\d+%',                    # Percentages
-            r'\$\d+(?:,\d{3})*',       # Dollar amounts
-            r'\d+(?:,\d{3})*\+?',      # Numbers with commas
-            r'\d+k\+?',                # Numbers with k (thousand)
-            r'\d+M\+?',                # Numbers with M (million)
-            r'\d+B\+?',                # Numbers with B (billion)
-        ]
-        
-        return any(re.search(pattern, text) for pattern in patterns)
+        return HAS_METRIC_PATTERN.search(text) is not None
 
     def extract_keywords(self, text: str) -> Dict[str, Set[str]]:
         """
@@ -88,7 +75,7 @@ class TextProcessor:
         for token in doc:
             # Technical terms (usually nouns)
             if token.pos_ == "NOUN":
-                keywords['technical'].add(token.text.lower())
+                keywords['technical'].add(token.lower_)
             
             # Action verbs
             elif token.pos_ == "VERB":
@@ -102,18 +89,16 @@ class TextProcessor:
 
     def calculate_text_similarity(self, text1: str, text2: str) -> float:
         """
-        Calculate similarity between two texts using spaCy
+        Calculate cosine similarity between two texts using cached embedding vectors
         """
-        doc1 = nlp(text1)
-        doc2 = nlp(text2)
-        return doc1.similarity(doc2)
+        return similarity_engine.similarity(text1, text2)
 
     def format_bullet_point(self, text: str) -> str:
         """
         Format text as a proper bullet point
         """
         # Remove existing bullet points
-        text = re.sub(r'^[•\-\*○►‣⁃·]\s*', '', text.strip())
+        text = LEADING_BULLET_PATTERN.sub('', text.strip())
         
         # Ensure it starts with a capital letter
         text = text[0].upper() + text[1:] if text else text
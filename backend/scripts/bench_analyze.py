@@ -0,0 +1,271 @@
+"""
+Benchmark the shared normalization/pattern layer against the previous inline
+regex code, reporting time per call and, for one call, peak traced memory and
+the number of memory blocks it left allocated (cache entries, compiled
+patterns and other retained objects).
+
+By default every run gets a new job description with its own keyword set, so
+the normalization and pattern caches start cold for the job side, as they do
+for a real /analyze request; --warm reuses one job description instead.
+--full compares the whole /analyze pipeline (keyword extraction with spaCy and
+ATS scoring) against the previous implementation and loads the models.
+
+Run from the backend directory:
+    python -m scripts.bench_analyze                # keyword matching and line scanning
+    python -m scripts.bench_analyze --full         # also the full /analyze pipeline
+"""
+from app.models import Resume, ResumeSection
+from app.utils.skills import TECHNICAL_SKILLS, SOFT_SKILLS
+from app.utils.text_patterns import find_keywords, HAS_METRIC_PATTERN, SECTION_HEADER_PATTERN
+from collections import defaultdict
+from typing import Callable, List, Sequence
+import argparse
+import random
+import tracemalloc
+import time
+import re
+
+SKILLS = [skill for skills in TECHNICAL_SKILLS.values() for skill in skills] + SOFT_SKILLS
+
+JOB_SENTENCES = [
+    "We are looking for a Senior Software Engineer with experience with {0} and {1}.",
+    "Required: strong knowledge of {0}, {1} and {2}.",
+    "Experience with {0} is preferred, familiarity with {1} is a plus.",
+    "Must have excellent {0} and {1} skills.",
+    "You will own {0} services and work closely with the {1} team.",
+]
+
+def build_job_descriptions(count: int, seed: int = 0) -> List[str]:
+    """
+    Distinct job descriptions, each mentioning its own random set of skills
+    """
+    rng = random.Random(seed)
+    descriptions = []
+    for index in range(count):
+        sentences = [f"Posting {index}."]
+        for _ in range(30):
+            template = rng.choice(JOB_SENTENCES)
+            sentences.append(template.format(*rng.sample(SKILLS, 3)))
+        descriptions.append(' '.join(sentences))
+    return descriptions
+
+def build_resume(sections: int = 6, bullets: int = 15) -> Resume:
+    resume_sections = [
+        ResumeSection(
+            title=f"SECTION {i}",
+            content='\n'.join(
+                f"• Developed service {i}-{j} with Python and Docker for 2M users, reducing latency by {j * 5}%"
+                for j in range(bullets)
+            )
+        )
+        for i in range(sections)
+    ]
+    raw_text = '\n'.join(f"{s.title}\n{s.content}" for s in resume_sections)
+    return Resume(sections=resume_sections, raw_text=raw_text)
+
+# Previous implementations, kept here for comparison only
+
+def legacy_match(resume: Resume, text: str) -> int:
+    found = [skill for skill in SKILLS if re.search(rf'\b{re.escape(skill)}\b', text.lower())]
+    hits = sum(1 for kw in found if re.search(rf'\b{re.escape(kw)}\b', resume.raw_text, re.IGNORECASE))
+    for section in resume.sections:
+        hits += sum(1 for kw in found if re.search(rf'\b{re.escape(kw)}\b', section.content, re.IGNORECASE))
+    return hits
+
+def legacy_lines(resume: Resume) -> int:
+    section_headers = ["EDUCATION", "EXPERIENCE", "WORK EXPERIENCE", "SKILLS", "TECHNICAL SKILLS",
+                       "PROJECTS", "CERTIFICATIONS", "AWARDS", "PROFESSIONAL SUMMARY", "OBJECTIVE"]
+    pattern = f"({'|'.join(section_headers)})[:\\s]*"
+    patterns = [r'\d+%', r'\$\d+(?:,\d{3})*', r'\d+(?:,\d{3})*\+?', r'\d+k\+?', r'\d+M\+?', r'\d+B\+?']
+    count = 0
+    for line in resume.raw_text.split('\n'):
+        count += bool(re.match(pattern, line.strip().upper()))
+        count += any(re.search(p, line) for p in patterns)
+    return count
+
+def legacy_analyze(resume: Resume, text: str):
+    """
+    extract_keywords + calculate_ats_score as they were before the pattern layer
+    """
+    from app.models import Keyword, AnalysisResult
+    from app.services.keyword_extractor import nlp, is_technical_skill, rank_sections_for_keywords, corpus_stats
+
+    def relevance(doc, keyword):
+        frequency = len(re.findall(rf'\b{re.escape(keyword)}\b', doc.text.lower()))
+        importance_words = ['required', 'essential', 'must', 'key', 'primary', 'core',
+                            'preferred', 'desired', 'important', 'necessary']
+        context_score = 0
+        for token in doc:
+            if token.text.lower() in keyword:
+                surrounding = doc[max(0, token.i-5):min(len(doc), token.i+6)]
+                for word in surrounding:
+                    if word.text.lower() in importance_words:
+                        context_score += 1
+        freq_score = min(frequency / 3, 1.0)
+        context_score = min(context_score / 2, 1.0)
+        return ((freq_score * 0.7) + (context_score * 0.3)) * corpus_stats.weight(keyword)
+
+    def likely_skill(term, doc):
+        for token in doc:
+            if token.text.lower() == term:
+                if any(t.text.lower() in ['skilled', 'experience', 'knowledge', 'proficient']
+                       for t in doc[max(0, token.i-3):token.i]):
+                    return True
+                if any(t.text.lower() in ['experience', 'skills', 'knowledge']
+                       for t in doc[token.i+1:min(len(doc), token.i+4)]):
+                    return True
+        return False
+
+    doc = nlp(text.lower())
+    keywords = []
+    for skills in TECHNICAL_SKILLS.values():
+        for skill in skills:
+            if re.search(rf'\b{re.escape(skill)}\b', text.lower()):
+                keywords.append(Keyword(text=skill, category='technical', relevance_score=relevance(doc, skill)))
+    for skill in SOFT_SKILLS:
+        if re.search(rf'\b{re.escape(skill)}\b', text.lower()):
+            keywords.append(Keyword(text=skill, category='soft', relevance_score=relevance(doc, skill)))
+
+    dynamic = []
+    skill_indicators = ['experience with', 'knowledge of', 'proficiency in', 'skilled in',
+                        'familiarity with', 'background in', 'expertise in', 'working knowledge']
+    for indicator in skill_indicators:
+        for match in re.finditer(rf'{indicator}\s+([\w\s\-\/]+)', text.lower()):
+            skill = match.group(1).strip()
+            if match.group(1) and len(skill.split()) < 4:
+                dynamic.append(Keyword(text=skill, category='technical' if is_technical_skill(skill) else 'soft',
+                                       relevance_score=0.8 * corpus_stats.weight(skill)))
+    for ent in doc.ents:
+        if ent.label_ in ["ORG", "PRODUCT"] and len(ent.text.lower().split()) < 3:
+            dynamic.append(Keyword(text=ent.text.lower(), category='technical',
+                                   relevance_score=0.7 * corpus_stats.weight(ent.text.lower())))
+    for token in doc:
+        if token.pos_ in ["NOUN", "PROPN"] and not token.is_stop and len(token.text) > 3:
+            if likely_skill(token.text.lower(), doc):
+                dynamic.append(Keyword(text=token.text.lower(), category='technical',
+                                       relevance_score=0.6 * corpus_stats.weight(token.text)))
+    existing = {kw.text for kw in keywords}
+    for kw in dynamic:
+        if kw.text not in existing:
+            keywords.append(kw)
+            existing.add(kw.text)
+
+    missing, matched, section_scores, suggestions = defaultdict(list), defaultdict(list), {}, defaultdict(list)
+    candidates = []
+    for keyword in keywords:
+        if re.search(rf'\b{re.escape(keyword.text)}\b', resume.raw_text, re.IGNORECASE):
+            matched[keyword.category].append(keyword.text)
+        else:
+            missing[keyword.category].append(keyword.text)
+            if keyword.relevance_score > 0.7:
+                candidates.append(keyword.text)
+    for keyword_text, titles in rank_sections_for_keywords(resume, candidates).items():
+        for title in titles:
+            suggestion = f"Consider adding '{keyword_text}' to this section"
+            if suggestion not in suggestions[title]:
+                suggestions[title].append(suggestion)
+    for section in resume.sections:
+        matches = sum(1 for kw in keywords
+                      if re.search(rf'\b{re.escape(kw.text)}\b', section.content, re.IGNORECASE))
+        section_scores[section.title] = (matches / len(keywords) * 100) if keywords else 0
+    total_matched = len(matched['technical']) + len(matched['soft'])
+    return AnalysisResult(
+        ats_score=round(total_matched / len(keywords) * 100 if keywords else 0, 2),
+        missing_keywords=dict(missing),
+        matched_keywords=dict(matched),
+        section_scores=section_scores,
+        improvement_suggestions=dict(suggestions),
+        keyword_relevance={kw.text: kw.relevance_score for kw in keywords}
+    )
+
+# Current implementations through app.utils.text_patterns
+
+def layer_match(resume: Resume, text: str) -> int:
+    present = find_keywords(text, SKILLS)
+    found = [skill for skill in SKILLS if skill in present]
+    in_resume = find_keywords(resume.raw_text, found)
+    hits = sum(1 for kw in found if kw in in_resume)
+    for section in resume.sections:
+        in_section = find_keywords(section.content, found)
+        hits += sum(1 for kw in found if kw in in_section)
+    return hits
+
+def layer_lines(resume: Resume) -> int:
+    count = 0
+    for line in resume.raw_text.split('\n'):
+        count += bool(SECTION_HEADER_PATTERN.match(line.strip()))
+        count += HAS_METRIC_PATTERN.search(line) is not None
+    return count
+
+def layer_analyze(resume: Resume, text: str):
+    from app.services.keyword_extractor import extract_keywords, calculate_ats_score
+    return calculate_ats_score(resume, extract_keywords(text))
+
+def measure(func: Callable, inputs: Sequence[str], memory_input: str) -> List[float]:
+    """
+    Return (microseconds per call over inputs, peak traced KB and retained blocks of one call on memory_input)
+    """
+    start = time.perf_counter()
+    for text in inputs:
+        func(text)
+    per_call = (time.perf_counter() - start) / len(inputs) * 1e6
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    func(memory_input)
+    peak = tracemalloc.get_traced_memory()[1] / 1024
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    return [per_call, peak, retained]
+
+class JobDescriptions:
+    """
+    Hands out job descriptions: a new one for every call when cold, the same one when warm
+    """
+    def __init__(self, warm: bool):
+        self.warm = warm
+        self.next_index = 0
+
+    def take(self, count: int) -> List[str]:
+        if self.warm:
+            return build_job_descriptions(1) * count
+        descriptions = build_job_descriptions(self.next_index + count)[self.next_index:]
+        self.next_index += count
+        return descriptions
+
+def compare(name: str, legacy: Callable, layer: Callable, descriptions: JobDescriptions, runs: int) -> None:
+    """
+    Check both implementations agree, then print one row per implementation. Each
+    implementation gets its own job descriptions, so neither warms the other's caches.
+    """
+    check = descriptions.take(1)[0]
+    assert legacy(check) == layer(check), f"{name}: implementations disagree"
+    for impl, func in (('inline', legacy), ('layer', layer)):
+        inputs = descriptions.take(runs + 1)
+        per_call, peak, retained = measure(func, inputs[:-1], inputs[-1])
+        print(f"{name:<24}{impl:<10}{per_call:>12.1f}{peak:>10.1f}{retained:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the text normalization and pattern layer")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--warm", action="store_true", help="Reuse one job description (warm caches)")
+    parser.add_argument("--full", action="store_true", help="Also compare the full /analyze pipeline (loads models)")
+    args = parser.parse_args()
+
+    resume = build_resume()
+    descriptions = JobDescriptions(args.warm)
+
+    print(f"{'warm' if args.warm else 'cold'} caches, {args.runs} runs")
+    print(f"{'case':<24}{'impl':<10}{'us/call':>12}{'peak KB':>10}{'blocks':>10}")
+    compare('keyword matching', lambda text: legacy_match(resume, text), lambda text: layer_match(resume, text),
+            descriptions, args.runs)
+    compare('header + metric lines', lambda text: legacy_lines(resume), lambda text: layer_lines(resume),
+            descriptions, args.runs)
+
+    if args.full:
+        compare('/analyze pipeline', lambda text: legacy_analyze(resume, text),
+                lambda text: layer_analyze(resume, text), descriptions, max(1, args.runs // 20))
+
+if __name__ == "__main__":
+    main()
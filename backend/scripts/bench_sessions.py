@@ -0,0 +1,81 @@
+"""
+Compare /analyze request payload sizes and response encoding latency
+with and without resume sessions.
+
+Run from the backend directory:
+    python -m scripts.bench_sessions
+"""
+from app.models import Resume, ResumeSection, AnalysisResult
+from app.services.session_store import ResumeSessionStore
+import tempfile
+import timeit
+import json
+import os
+import orjson
+
+def build_resume(sections: int = 6, bullets: int = 8) -> Resume:
+    """
+    Build a synthetic resume of roughly realistic size
+    """
+    resume_sections = [
+        ResumeSection(
+            title=f"SECTION {i}",
+            content='\n'.join(
+                f"• Developed service {i}-{j} with Python and Docker, reducing latency by {j * 5}%"
+                for j in range(bullets)
+            )
+        )
+        for i in range(sections)
+    ]
+    raw_text = '\n'.join(f"{s.title}\n{s.content}" for s in resume_sections)
+    return Resume(sections=resume_sections, raw_text=raw_text)
+
+def build_analysis(keywords: int = 60) -> AnalysisResult:
+    """
+    Build a synthetic analysis response
+    """
+    names = [f"keyword {i}" for i in range(keywords)]
+    return AnalysisResult(
+        ats_score=42.5,
+        missing_keywords={'technical': names[::2], 'soft': names[1::4]},
+        matched_keywords={'technical': names[1::2], 'soft': names[::4]},
+        section_scores={f"SECTION {i}": i * 7.5 for i in range(6)},
+        improvement_suggestions={
+            f"SECTION {i}": [f"Consider adding '{n}' to this section" for n in names[i::6]]
+            for i in range(6)
+        }
+    )
+
+def main():
+    job_desc = {'text': "We are looking for a Python engineer with FastAPI experience. " * 40}
+    resume = build_resume()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResumeSessionStore(db_path=os.path.join(tmp, "sessions.db"))
+        resume_id = store.create(resume)
+
+        full_body = json.dumps({'job_desc': job_desc, 'resume': resume.model_dump()})
+        session_body = json.dumps({
+            'job_desc': job_desc,
+            'resume_id': resume_id,
+            'section_updates': [resume.sections[0].model_dump()]
+        })
+        print(f"/analyze body, full resume:      {len(full_body):>7} bytes")
+        print(f"/analyze body, session + delta:  {len(session_body):>7} bytes "
+              f"({len(session_body) / len(full_body):.0%})")
+
+        runs = 2000
+        parse_full = timeit.timeit(lambda: Resume.model_validate_json(json.dumps(resume.model_dump())), number=runs)
+        load_session = timeit.timeit(lambda: store.get(resume_id), number=runs)
+        print(f"resume from request body:        {parse_full / runs * 1e6:>7.1f} us")
+        print(f"resume from session store:       {load_session / runs * 1e6:>7.1f} us")
+
+    analysis = build_analysis().model_dump()
+    runs = 5000
+    stdlib = timeit.timeit(lambda: json.dumps(analysis).encode(), number=runs)
+    fast = timeit.timeit(lambda: orjson.dumps(analysis), number=runs)
+    print(f"AnalysisResult encode, json:     {stdlib / runs * 1e6:>7.1f} us")
+    print(f"AnalysisResult encode, orjson:   {fast / runs * 1e6:>7.1f} us")
+
+if __name__ == "__main__":
+    main()
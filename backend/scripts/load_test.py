@@ -0,0 +1,272 @@
+"""
+End-to-end load test for the Resume Optimizer API.
+
+Starts a local uvicorn server (with the stub generator unless --real-model is
+given), replays a weighted mix of /upload-resume, /analyze and /optimize-section
+calls from concurrent asyncio clients and reports throughput and latency
+percentiles per endpoint.
+
+Run from the backend directory:
+    python -m scripts.load_test --users 20 --duration 60 --stub-latency-ms 50
+    python -m scripts.load_test --url http://localhost:8000   # existing server
+"""
+from collections import defaultdict
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import math
+import random
+import subprocess
+import time
+import sys
+import os
+import io
+import httpx
+import docx
+
+JOB_DESCRIPTION = """
+We are looking for a Senior Software Engineer with experience with Python, FastAPI and Docker.
+Required: strong knowledge of PostgreSQL, Redis and AWS. Experience with Kubernetes and CI/CD is preferred.
+Must have excellent communication, leadership and problem solving skills. Familiarity with machine learning,
+React and TypeScript is a plus. Key responsibilities include designing microservices and REST API development.
+"""
+
+RESUME_SECTIONS = {
+    "PROFESSIONAL SUMMARY": [
+        "Backend engineer with 6 years of experience building web services.",
+    ],
+    "EXPERIENCE": [
+        "Developed order processing service in Python handling 2M requests per day",
+        "Led migration of legacy monolith to containerized services, cutting deploy time by 60%",
+        "Designed caching layer that reduced database load by 35%",
+        "Mentored 4 junior engineers and ran weekly code reviews",
+    ],
+    "PROJECTS": [
+        "Built a real-time chat application with websockets and a React frontend",
+        "Created a data pipeline that ingests 500k events per hour",
+    ],
+    "SKILLS": [
+        "Python, Java, SQL, Git, Linux, Flask",
+    ],
+}
+
+def build_resume_docx() -> bytes:
+    """
+    Build a small synthetic resume as DOCX bytes
+    """
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    for title, bullets in RESUME_SECTIONS.items():
+        document.add_paragraph(title)
+        for bullet in bullets:
+            document.add_paragraph(f"• {bullet}")
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values), max(1, math.ceil(pct / 100 * len(sorted_values)))) - 1
+    return sorted_values[rank]
+
+class LoadTest:
+    def __init__(self, base_url: str, users: int, duration: float, mix: Dict[str, float], seed: int,
+                 deadline_ms: Optional[float] = None):
+        self.base_url = base_url
+        self.deadline_ms = deadline_ms
+        self.users = users
+        self.duration = duration
+        self.mix = mix
+        self.random = random.Random(seed)
+        self.resume_bytes = build_resume_docx()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def _timed(self, endpoint: str, request) -> Optional[httpx.Response]:
+        """
+        Run a request coroutine and record its latency under the endpoint name. Only
+        successful responses are timed; failures are counted as errors instead.
+        """
+        start = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            self.errors[endpoint] += 1
+            return None
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+            return None
+        self.latencies[endpoint].append(time.perf_counter() - start)
+        return response
+
+    async def _upload(self, client: httpx.AsyncClient) -> Optional[dict]:
+        response = await self._timed("/upload-resume", client.post(
+            "/upload-resume",
+            files={"file": ("resume.docx", self.resume_bytes,
+                            "application/vnd.openxmlformats-officedocument.wordprocessingml.document")}
+        ))
+        return response.json() if response is not None else None
+
+    async def _analyze(self, client: httpx.AsyncClient, session: dict) -> Optional[dict]:
+        response = await self._timed("/analyze", client.post(
+            "/analyze",
+            json={"job_desc": {"text": JOB_DESCRIPTION}, "resume_id": session["resume_id"]}
+        ))
+        return response.json() if response is not None else None
+
+    async def _optimize(self, client: httpx.AsyncClient, session: dict, analysis: Optional[dict]) -> None:
+        section = self.random.choice(session["sections"])
+        missing = analysis["missing_keywords"] if analysis else {}
+        keywords = (missing.get("technical", []) + missing.get("soft", []))[:3] or ["fastapi", "docker"]
+        await self._timed("/optimize-section", client.post(
+            "/optimize-section",
+            json={
+                "section_title": section["title"],
+                "resume_id": session["resume_id"],
+                "selected_keywords": keywords,
+                "deadline_ms": self.deadline_ms
+            }
+        ))
+
+    async def _user(self, deadline: float) -> None:
+        """
+        One virtual user: upload a resume, then keep replaying the request mix
+        """
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=300) as client:
+            session = await self._upload(client)
+            analysis = None
+            endpoints, weights = zip(*self.mix.items())
+            while time.perf_counter() < deadline:
+                endpoint = self.random.choices(endpoints, weights)[0]
+                if endpoint == "/upload-resume" or session is None:
+                    session = await self._upload(client) or session
+                elif endpoint == "/analyze":
+                    analysis = await self._analyze(client, session) or analysis
+                elif session["sections"]:
+                    await self._optimize(client, session, analysis)
+
+    async def run(self) -> float:
+        start = time.perf_counter()
+        deadline = start + self.duration
+        await asyncio.gather(*(self._user(deadline) for _ in range(self.users)))
+        return time.perf_counter() - start
+
+    def report(self, elapsed: float) -> bool:
+        """
+        Print throughput and latency percentiles of successful requests per endpoint.
+        Returns False when any request failed.
+        """
+        print(f"\n{self.users} users, {elapsed:.1f}s (latencies and req/s cover successful requests only)")
+        print(f"{'endpoint':<20}{'ok':>10}{'errors':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+        total = 0
+        for endpoint in self.mix:
+            values = sorted(self.latencies.get(endpoint, []))
+            total += len(values)
+            print(
+                f"{endpoint:<20}{len(values):>10}{self.errors.get(endpoint, 0):>8}"
+                f"{len(values) / elapsed:>9.2f}"
+                f"{percentile(values, 50) * 1000:>10.1f}"
+                f"{percentile(values, 95) * 1000:>10.1f}"
+                f"{percentile(values, 99) * 1000:>10.1f}"
+            )
+        errors = sum(self.errors.values())
+        print(f"{'total':<20}{total:>10}{errors:>8}{total / elapsed:>9.2f}")
+
+        passed = errors == 0
+        if errors:
+            print(f"\nFAILED: {errors} of {total + errors} requests failed ({errors / (total + errors):.1%})")
+
+        # The budget applies to /optimize-section only
+        optimize = sorted(self.latencies.get("/optimize-section", []))
+        if self.deadline_ms is not None and optimize:
+            p95_ms = percentile(optimize, 95) * 1000
+            within = p95_ms <= self.deadline_ms
+            print(
+                f"\n{'OK' if within else 'FAILED'}: /optimize-section p95 {p95_ms:.1f} ms "
+                f"{'within' if within else 'exceeds'} the {self.deadline_ms:.0f} ms budget"
+            )
+            passed = passed and within
+        return passed
+
+def start_server(port: int, real_model: bool, stub_latency_ms: float) -> subprocess.Popen:
+    """
+    Start a local uvicorn server and wait until /health responds
+    """
+    env = dict(os.environ)
+    env["JOB_WORKER_AUTOSTART"] = "false"
+    if not real_model:
+        env["GENERATOR_MODE"] = "stub"
+        env["STUB_GENERATOR_LATENCY_MS"] = str(stub_latency_ms)
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=backend_dir,
+        env=env
+    )
+
+    deadline = time.time() + 600
+    while time.time() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("Server exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return server
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+
+    server.terminate()
+    raise RuntimeError("Server did not become healthy in time")
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """
+    Parse 'upload=1,analyze=4,optimize=2' into endpoint weights
+    """
+    names = {"upload": "/upload-resume", "analyze": "/analyze", "optimize": "/optimize-section"}
+    mix = {}
+    for part in value.split(","):
+        name, weight = part.split("=")
+        mix[names[name.strip()]] = float(weight)
+    return mix
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Resume Optimizer API")
+    parser.add_argument("--url", help="Use an already running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Test duration in seconds")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("upload=1,analyze=4,optimize=2"))
+    parser.add_argument("--real-model", action="store_true", help="Use flan-t5 instead of the stub generator")
+    parser.add_argument("--stub-latency-ms", type=float, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--deadline-ms", type=float,
+                        help="Latency budget sent with /optimize-section; the run fails if its p95 exceeds it")
+    args = parser.parse_args()
+
+    passed = False
+    server = None
+    base_url = args.url
+    if base_url is None:
+        server = start_server(args.port, args.real_model, args.stub_latency_ms)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    try:
+        load_test = LoadTest(base_url, args.users, args.duration, args.mix, args.seed, args.deadline_ms)
+        elapsed = asyncio.run(load_test.run())
+        passed = load_test.report(elapsed)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    if not passed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Compare total memory of N workers started by the preload-and-fork server
+(python -m app.server) against N independent uvicorn workers, where every
+worker loads its own copy of the models. The background job worker is enabled
+and one optimization job is run before measuring, so the job worker's models
+are counted too.
+
+Reports RSS (double counts shared pages) and PSS (shares them out fairly).
+Linux only. Run from the backend directory:
+    python -m scripts.measure_rss --workers 4
+"""
+from typing import Dict, List
+import argparse
+import subprocess
+import time
+import sys
+import os
+import httpx
+
+def children_of(root: int) -> List[int]:
+    """
+    PIDs of a process and all of its descendants
+    """
+    parents: Dict[int, int] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                # Field 4 is the parent PID; split after the parenthesised command name
+                parents[int(entry)] = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+
+    tree = [root]
+    for pid in tree:
+        tree.extend(child for child, parent in parents.items() if parent == pid)
+    return tree
+
+def memory_mb(pid: int) -> Dict[str, float]:
+    """
+    RSS and PSS of a process in MB, from /proc/<pid>/smaps_rollup
+    """
+    values = {'rss': 0.0, 'pss': 0.0}
+    with open(f"/proc/{pid}/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith("Rss:"):
+                values['rss'] = int(line.split()[1]) / 1024
+            elif line.startswith("Pss:"):
+                values['pss'] = int(line.split()[1]) / 1024
+    return values
+
+def run_job(port: int, timeout: float = 600) -> None:
+    """
+    Run one optimization job to completion, so the job worker has loaded its models
+    """
+    resume = {
+        "sections": [{"title": "EXPERIENCE", "content": "• Developed order processing service in Python"}],
+        "raw_text": "EXPERIENCE\n• Developed order processing service in Python"
+    }
+    base_url = f"http://127.0.0.1:{port}"
+    response = httpx.post(f"{base_url}/jobs", json={"resume": resume, "selected_keywords": {"EXPERIENCE": ["docker"]}})
+    response.raise_for_status()
+    job_id = response.json()["job_id"]
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = httpx.get(f"{base_url}/jobs/{job_id}").json()["status"]
+        if status not in ("queued", "running"):
+            if status != "completed":
+                raise RuntimeError(f"Warm-up job ended as {status}")
+            return
+        time.sleep(1)
+    raise RuntimeError("Warm-up job did not finish in time")
+
+def measure(command: List[str], env: Dict[str, str], port: int, workers: int, settle: float) -> Dict[str, float]:
+    """
+    Start a server, wait until it and its workers are up, run one job, and sum memory over its process tree
+    """
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    server = subprocess.Popen(command, cwd=backend_dir, env=env)
+    try:
+        deadline = time.time() + 900
+        while time.time() < deadline:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            time.sleep(1)
+        else:
+            raise RuntimeError(f"{command} did not become healthy")
+
+        # Give the remaining workers time to finish loading
+        time.sleep(settle)
+        run_job(port)
+        pids = children_of(server.pid)
+        totals = {'rss': 0.0, 'pss': 0.0}
+        for pid in pids:
+            try:
+                for key, value in memory_mb(pid).items():
+                    totals[key] += value
+            except OSError:
+                continue
+        totals['processes'] = len(pids)
+        return totals
+    finally:
+        server.terminate()
+        server.wait(timeout=60)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare server memory use with and without preloading")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--settle", type=float, default=30, help="Seconds to wait after the first healthy response")
+    args = parser.parse_args()
+
+    env = dict(os.environ, JOB_WORKER_AUTOSTART="true", PORT=str(args.port), HOST="127.0.0.1",
+               SERVER_WORKERS=str(args.workers))
+
+    setups = {
+        'uvicorn --workers (per-worker models)': [
+            sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+            "--port", str(args.port), "--workers", str(args.workers)
+        ],
+        'app.server (preload + fork)': [sys.executable, "-m", "app.server"],
+    }
+
+    print(f"{'setup':<40}{'processes':>10}{'RSS MB':>12}{'PSS MB':>12}")
+    for name, command in setups.items():
+        totals = measure(command, env, args.port, args.workers, args.settle)
+        print(f"{name:<40}{totals['processes']:>10}{totals['rss']:>12.0f}{totals['pss']:>12.0f}")
+
+if __name__ == "__main__":
+    main()
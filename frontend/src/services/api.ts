@@ -28,10 +28,21 @@ export const analyzeResume = async (
   jobDescription: string,
   resume: Resume
 ): Promise<AnalysisResult> => {
-  const response = await api.post('/analyze', {
-    job_desc: { text: jobDescription },
-    resume: resume
-  });
+  // Reference the server-side session instead of resending the whole resume
+  const job_desc = { text: jobDescription };
+  let response;
+  try {
+    response = await api.post('/analyze', resume.resume_id
+      ? { job_desc, resume_id: resume.resume_id }
+      : { job_desc, resume }
+    );
+  } catch (error) {
+    // Sessions expire; fall back to sending the resume we still have
+    if (!resume.resume_id || !axios.isAxiosError(error) || error.response?.status !== 404) {
+      throw error;
+    }
+    response = await api.post('/analyze', { job_desc, resume });
+  }
 
   // Make sure to include matched_keywords in the transformed response
   return {
@@ -39,7 +50,8 @@ export const analyzeResume = async (
     missing_keywords: response.data.missing_keywords,
     matched_keywords: response.data.matched_keywords, // Add this line
     section_scores: response.data.section_scores,
-    improvement_suggestions: response.data.improvement_suggestions
+    improvement_suggestions: response.data.improvement_suggestions,
+    keyword_relevance: response.data.keyword_relevance
   };
 };
 
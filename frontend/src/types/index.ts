@@ -15,6 +15,7 @@
     };
     section_scores: Record<string, number>;
     improvement_suggestions: Record<string, string[]>;
+    keyword_relevance?: Record<string, number>;
   }
   
   export interface OptimizationResponse {
@@ -31,6 +32,7 @@
   export interface Resume {
     sections: ResumeSection[];
     rawText: string;
+    resume_id?: string;
   }
   
   export interface FileUploadProps {